@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import importlib.util
 import io
 import json
+import re
 import zipfile
 import xml.etree.ElementTree as ET
 from datetime import datetime
@@ -17,14 +19,23 @@ from dateutil import parser
 # 프로젝트 설정 파일 import
 import config
 
-# 선택적 의존성 import
+# 선택적 의존성: 설치 여부만 확인하고 실제 import는 구글 시트를 읽을 때 수행
 try:
-    import gspread
-    from google.oauth2.service_account import Credentials
-    _GSPREAD_AVAILABLE = True
-except ImportError:
+    _GSPREAD_AVAILABLE = (
+        importlib.util.find_spec('gspread') is not None
+        and importlib.util.find_spec('google.oauth2') is not None
+    )
+except ModuleNotFoundError:
     _GSPREAD_AVAILABLE = False
 
+# 경제/기업 일반 키워드 (관련 뉴스 완화 필터용)
+_ECONOMY_KEYWORD_RE = re.compile(r'기업|경제|주식|투자|매출|실적|영업이익')
+
+# 뉴스 텍스트 정리용 정규식 (모듈 로드 시 1회 컴파일)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s가-힣\-\.\,\!\?\(\)]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class DartAPICollector:
     """DART API를 통해 재무 데이터를 수집하는 클래스"""
@@ -289,6 +300,9 @@ class SKNewsCollector:
         if not _GSPREAD_AVAILABLE or not self.sheet_id or not self.service_account_json:
             return pd.DataFrame()
         try:
+            import gspread
+            from google.oauth2.service_account import Credentials
+
             creds = Credentials.from_service_account_info(self.service_account_json)
             gc = gspread.authorize(creds)
             worksheet = gc.open_by_key(self.sheet_id).sheet1
@@ -344,14 +358,13 @@ class SKNewsCollector:
             return ""
         
         # HTML 태그 제거
-        import re
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_TAG_RE.sub('', text)
         
         # 특수문자 정리
-        text = re.sub(r'[^\w\s가-힣\-\.\,\!\?\(\)]', '', text)
+        text = _SPECIAL_CHAR_RE.sub('', text)
         
         # 연속된 공백 제거
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         return text.strip()
 
@@ -360,39 +373,25 @@ class SKNewsCollector:
         if df.empty:
             return df
         
-        relevant_news = []
-        for _, row in df.iterrows():
-            title = str(row.get('제목', '')).lower()
-            summary = str(row.get('요약', '')).lower()
-            full_text = f"{title} {summary}"
-            
-            # 키워드 매칭 카운트
-            keyword_count = 0
-            
-            # 회사명 키워드 (가중치 높음)
-            company_matches = sum(1 for kw in self.company_keywords if kw.lower() in full_text)
-            keyword_count += company_matches * 2
-            
-            # 산업 키워드
-            industry_matches = sum(1 for kw in self.industry_keywords if kw.lower() in full_text)
-            keyword_count += industry_matches
-            
-            # 비즈니스 키워드
-            business_matches = sum(1 for kw in self.business_keywords if kw.lower() in full_text)
-            keyword_count += business_matches
-            
-            # 트렌드 키워드
-            trend_matches = sum(1 for kw in self.trend_keywords if kw.lower() in full_text)
-            keyword_count += trend_matches
-            
-            # 완화된 필터링 기준
-            if keyword_count >= 1:  # 최소 1개 키워드만 있어도 포함
-                relevant_news.append(row)
-            # 또는 경제/기업 관련 키워드가 있으면 포함
-            elif any(kw in full_text for kw in ["기업", "경제", "주식", "투자", "매출", "실적", "영업이익"]):
-                relevant_news.append(row)
-        
-        return pd.DataFrame(relevant_news)
+        # 행 단위 루프 대신 키워드별로 전체 컬럼을 한 번에 검사
+        title = df['제목'].fillna('').astype(str) if '제목' in df.columns else pd.Series('', index=df.index)
+        summary = df['요약'].fillna('').astype(str) if '요약' in df.columns else pd.Series('', index=df.index)
+        full_text = (title + ' ' + summary).str.lower()
+        
+        def _count_matches(keywords):
+            return sum(full_text.str.contains(kw.lower(), regex=False) for kw in keywords)
+        
+        # 키워드 매칭 카운트 (회사명 키워드는 가중치 2)
+        keyword_count = (
+            _count_matches(self.company_keywords) * 2
+            + _count_matches(self.industry_keywords)
+            + _count_matches(self.business_keywords)
+            + _count_matches(self.trend_keywords)
+        )
+        
+        # 완화된 필터링 기준: 최소 1개 키워드 또는 경제/기업 관련 키워드 포함
+        relevant = (keyword_count >= 1) | full_text.str.contains(_ECONOMY_KEYWORD_RE)
+        return df[relevant]
 
     def _enrich_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         if df.empty: 
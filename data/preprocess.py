@@ -7,6 +7,34 @@ import streamlit as st
 from bs4 import BeautifulSoup
 
 _KRW_RE = re.compile(r'(krw|원|won)', re.IGNORECASE)
+# 숫자 파싱용 (fact/태그마다 반복 사용되므로 모듈 로드 시 1회 컴파일)
+_DIGIT_RE = re.compile(r'\d')
+_NON_NUMERIC_RE = re.compile(r'[^\d\.-]')
+# 백업 스캐너: 태그 정보 문자열 → 표준 계정 매핑
+_BACKUP_ITEM_PATTERNS = [
+    (re.compile(rx, re.IGNORECASE), std) for rx, std in {
+        r'(revenue|sales)(?!.*cost)': '매출액',
+        r'(cost.*(sales|goods))|매출원가|원가': '매출원가',
+        r'(gross.*profit|매출총이익)': '매출총이익',
+        r'(selling.*administrative|판관비|판매비.*관리비)': '판매비와관리비',
+        r'(operating.*(income|profit)|영업이익)': '영업이익',
+        r'(profitloss$|netincome$|netprofit$|당기순이익)': '당기순이익'
+    }.items()
+]
+
+# 컨텍스트 id 문자열의 분기 기간 패턴 (보고서 유형별, 그 외는 4분기)
+_QUARTER_CONTEXT_RE = {
+    'Q3': re.compile(r'(7.?01|07.?01).*(9.?30|09.?30)'),
+    'Q2': re.compile(r'(4.?01|04.?01).*(6.?30|06.?30)'),
+    'Q1': re.compile(r'(1.?01|01.?01).*(3.?31|03.?31)'),
+}
+_Q4_CONTEXT_RE = re.compile(r'(10.?01).*(12.?31)')
+# 파일명 기반 회사명 정리용
+_COMPANY_NAME_CLEAN_RE = re.compile(r'[^A-Za-z가-힣0-9\s]')
+
+# 재무제표 표시 순서 (손익 항목 → 비율 항목), 회사별 표 병합 후 행 정렬에 사용
+_STATEMENT_ITEMS = ['매출액','매출원가','매출총이익','판매비와관리비','영업이익','영업외수익','영업외비용','당기순이익']
+_ROW_ORDER = _STATEMENT_ITEMS + ['영업이익률(%)','매출총이익률(%)','순이익률(%)','매출원가율(%)','판관비율(%)']
 
 def _localname(qname: str) -> str:
     if not qname:
@@ -149,7 +177,7 @@ class FinancialDataProcessor:
         }
         for k,v in mapping.items():
             if k in name: return v
-        clean = re.sub(r'[^A-Za-z가-힣0-9\s]','', name) or "Unknown Company"
+        clean = _COMPANY_NAME_CLEAN_RE.sub('', name) or "Unknown Company"
         return clean
 
     # ---------------- Facts building ----------------
@@ -200,7 +228,7 @@ class FinancialDataProcessor:
             text = (el.text or '').strip()
             if not text: continue
             try:
-                val = float(re.sub(r'[^\d\.-]', '', text.replace('(', '-').replace(')', '')))
+                val = float(_NON_NUMERIC_RE.sub('', text.replace('(', '-').replace(')', '')))
             except Exception:
                 continue
             cref = el.get('contextRef') or el.get('contextref')
@@ -298,14 +326,7 @@ class FinancialDataProcessor:
         dur = facts[(facts['period_type']=='duration') & (facts['end'].dt.year==latest_year)].copy()
         if dur.empty:
             return dur
-        if report_type=='Q3':
-            pat = re.compile(r'(7.?01|07.?01).*(9.?30|09.?30)')
-        elif report_type=='Q2':
-            pat = re.compile(r'(4.?01|04.?01).*(6.?30|06.?30)')
-        elif report_type=='Q1':
-            pat = re.compile(r'(1.?01|01.?01).*(3.?31|03.?31)')
-        else:
-            pat = re.compile(r'(10.?01).*(12.?31)')
+        pat = _QUARTER_CONTEXT_RE.get(report_type, _Q4_CONTEXT_RE)
         mask = dur['context_id'].astype(str).str.contains(pat, regex=True, na=False)
         return dur[mask]
 
@@ -356,11 +377,11 @@ class FinancialDataProcessor:
     # ------------- Backup scanner -------------
     def _backup_scan(self, soup: BeautifulSoup) -> dict:
         items, processed = {}, 0
-        numeric = [t for t in soup.find_all() if t.string and re.search(r'\d', t.string)]
+        numeric = [t for t in soup.find_all() if t.string and _DIGIT_RE.search(t.string)]
         for tag in numeric:
             txt = tag.string.strip()
             try:
-                num = float(re.sub(r'[^\d\.-]', '', txt.replace('(', '-').replace(')', '')))
+                num = float(_NON_NUMERIC_RE.sub('', txt.replace('(', '-').replace(')', '')))
             except Exception:
                 continue
             if abs(num) < 10000:
@@ -371,24 +392,16 @@ class FinancialDataProcessor:
             if tag.parent and tag.parent.name:
                 parts.append(tag.parent.name.lower())
             info = ' '.join(parts)
-            for rx, std in {
-                r'(revenue|sales)(?!.*cost)': '매출액',
-                r'(cost.*(sales|goods))|매출원가|원가': '매출원가',
-                r'(gross.*profit|매출총이익)': '매출총이익',
-                r'(selling.*administrative|판관비|판매비.*관리비)': '판매비와관리비',
-                r'(operating.*(income|profit)|영업이익)': '영업이익',
-                r'(profitloss$|netincome$|netprofit$|당기순이익)': '당기순이익'
-            }.items():
-                if re.search(rx, info, re.IGNORECASE):
+            for pat, std in _BACKUP_ITEM_PATTERNS:
+                if pat.search(info):
                     if std not in items or abs(num) > abs(items[std]):
                         items[std] = num
         return items
 
     # ------------- Statement / ratios / merge -------------
     def _build_statement(self, data: dict, company: str) -> pd.DataFrame:
-        order = ['매출액','매출원가','매출총이익','판매비와관리비','영업이익','영업외수익','영업외비용','당기순이익']
         rows = []
-        for k in order:
+        for k in _STATEMENT_ITEMS:
             if k in data:
                 rows.append({'구분': k, company: self._fmt_amt(data[k]), f'{company}_원시값': data[k]})
         sales = data.get('매출액', 0)
@@ -413,14 +426,21 @@ class FinancialDataProcessor:
     def merge_company_data(self, dataframes: list[pd.DataFrame]):
         if not dataframes: return pd.DataFrame()
         if len(dataframes) == 1: return dataframes[0]
-        merged = dataframes[0].copy()
+        # 회사별 표의 모든 컬럼(표시값 + '_원시값')을 회사당 한 번의 join으로 병합
+        # (컬럼마다 set_index/reset_index를 반복하지 않음, 원시값이 빠지면 갭/차트 분석이 첫 회사만 남음)
+        merged = dataframes[0].set_index('구분')
         for df in dataframes[1:]:
             try:
-                cols = [c for c in df.columns if c != '구분' and not c.endswith('_원시값')]
-                for c in cols:
-                    merged = merged.set_index('구분').join(df.set_index('구분')[c], how='outer').reset_index()
+                merged = merged.join(df.set_index('구분'), how='outer')
             except Exception as e:
                 st.warning(f"⚠️ 병합 중 오류: {e}")
+        merged = merged.reset_index()
+        # outer join은 회사마다 항목이 다르면 '구분'을 가나다순으로 정렬하므로 표시 순서로 되돌림
+        # (행마다 list.index를 호출하지 않고 Categorical 코드로 한 번에 정렬, 목록에 없는 항목은 맨 뒤)
+        merged = merged.sort_values(
+            '구분', key=lambda s: pd.Categorical(s, categories=_ROW_ORDER, ordered=True),
+            na_position='last', kind='stable'
+        ).reset_index(drop=True)
         return merged.fillna("-")
 
 # --- backward compatibility shim ---
@@ -8,21 +8,23 @@ def prepare_chart_data(df: pd.DataFrame):
         return pd.DataFrame()
     
     ratio_data = df[df['구분'].str.contains('%|점|억원', na=False)].copy()
-    companies = [col for col in ratio_data.columns if col != '구분' and not col.endswith('_원시값')]
+    # '_원시값' 컬럼 판별을 컬럼 Index에서 한 번에 처리
+    cols = ratio_data.columns.astype(str)
+    companies = ratio_data.columns[(cols != '구분') & ~cols.str.endswith('_원시값')].tolist()
     
-    chart_data_list = []
-    for _, row in ratio_data.iterrows():
-        for company in companies:
-            value_str = str(row.get(company, '0')).replace('%', '').replace('점', '').replace('억원', '')
-            try:
-                value = float(value_str)
-                chart_data_list.append({
-                    '지표': row['구분'], '회사': company, '수치': value
-                })
-            except (ValueError, TypeError):
-                continue
-    
-    return pd.DataFrame(chart_data_list)
+    if not companies:
+        return pd.DataFrame()
+
+    # wide → long 변환 후 단위 문자 제거 및 숫자 변환을 한 번에 처리 (변환 불가 값은 제외)
+    long_df = ratio_data.melt(
+        id_vars='구분', value_vars=companies, var_name='회사', value_name='수치', ignore_index=False
+    ).sort_index(kind='stable')
+    long_df['수치'] = pd.to_numeric(
+        long_df['수치'].astype(str).str.replace(r'%|점|억원', '', regex=True).str.strip(),
+        errors='coerce'
+    )
+    long_df = long_df.dropna(subset=['수치']).rename(columns={'구분': '지표'})
+    return long_df[['지표', '회사', '수치']].reset_index(drop=True)
 
 def create_dart_source_table(dart_collector: DartAPICollector, collected_companies: list, analysis_year: str):
     """DART 출처 정보 테이블 생성"""
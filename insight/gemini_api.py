@@ -1,19 +1,28 @@
 # -*- coding: utf-8 -*-
+import importlib.util
+from functools import lru_cache
 import streamlit as st
 import pandas as pd
 import config
 
+# google.generativeai는 import 비용이 커서(grpc/protobuf 로드) 설치 여부만 확인하고,
+# 실제 로드는 첫 모델 생성 시 1회
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
+    GEMINI_AVAILABLE = importlib.util.find_spec('google.generativeai') is not None
+except ModuleNotFoundError:
     GEMINI_AVAILABLE = False
 
+@lru_cache(maxsize=1)
+def _genai():
+    import google.generativeai as genai
+    return genai
+
 class GeminiInsightGenerator:
     """Gemini AI를 사용하여 분석 인사이트를 생성하는 클래스"""
     def __init__(self, api_key):
         if GEMINI_AVAILABLE and api_key:
             try:
+                genai = _genai()
                 genai.configure(api_key=api_key)
                 self.model = genai.GenerativeModel('gemini-1.5-flash')
             except Exception as e:
@@ -129,11 +138,12 @@ class GeminiInsightGenerator:
         if competitor_news.empty:
             return "분석할 경쟁사의 최신 뉴스가 없습니다."
 
-        news_data_str = ""
-        for i, row in enumerate(competitor_news.iterrows(), 1):
-            title = row[1].get('제목', '제목 없음')
-            company = row[1].get('회사', '회사 불명')
-            news_data_str += f"기사 {i} ({company}): {title}\n"
+        # 행 단위 iterrows 대신 컬럼 값을 한 번에 꺼내 기사 목록 문자열 생성
+        titles = competitor_news['제목'] if '제목' in competitor_news.columns else ['제목 없음'] * len(competitor_news)
+        news_data_str = "".join(
+            f"기사 {i} ({company}): {title}\n"
+            for i, (company, title) in enumerate(zip(competitor_news['회사'], titles), 1)
+        )
 
         prompt = f"""
         당신은 SK에너지의 수석 전략 분석가입니다. 아래 제공된 경쟁사들의 최신 뉴스 목록을 종합적으로 분석하여,
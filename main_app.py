@@ -52,11 +52,10 @@ def collect_charts_for_pdf():
         print("📊 재무분석 데이터 발견, 차트 생성 중...")
         final_df = st.session_state.financial_data
         ratio_df = final_df[final_df['구분'].str.contains('%', na=False)]
-        raw_cols = [col for col in final_df.columns if col.endswith('_원시값')]
+        _, raw_cols = split_raw_columns(final_df)
         
         if not ratio_df.empty and raw_cols:
-            chart_df = pd.melt(ratio_df, id_vars=['구분'], value_vars=raw_cols, var_name='회사', value_name='수치')
-            chart_df['회사'] = chart_df['회사'].str.replace('_원시값', '')
+            chart_df = melt_raw_ratio_columns(ratio_df, raw_cols)
             
             print(f"📊 차트 데이터 준비 완료: {len(chart_df)}개 항목")
             
@@ -134,15 +133,54 @@ def check_kaleido_status():
     except Exception as e:
         return False, f"❌ kaleido 의존성 오류: {e}"
         
+def _quarter_sort_key(col: pd.Series) -> pd.Series:
+    # '2024Q1' → 20241 (연도*10 + 분기) 정수 정렬키, 그 외 컬럼은 값 그대로 정렬
+    if col.name != '분기':
+        return col
+    parts = col.str.extract(r'(\d{4})Q([1-4])').astype(int)
+    return parts[0] * 10 + parts[1]
+
+def split_raw_columns(df: pd.DataFrame):
+    # '_원시값' 컬럼 마스크를 한 번만 계산해 (표시용 DataFrame, 원시값 컬럼 목록) 반환
+    raw_mask = df.columns.astype(str).str.endswith('_원시값')
+    return df.loc[:, ~raw_mask], df.columns[raw_mask].tolist()
+
+def melt_raw_ratio_columns(ratio_df: pd.DataFrame, raw_cols) -> pd.DataFrame:
+    # 원시값 컬럼명을 먼저 회사명으로 바꾼 뒤 melt (행마다 '_원시값' 치환하지 않음), 수치는 한 번에 숫자 변환
+    chart_df = (
+        ratio_df[['구분'] + list(raw_cols)]
+        .rename(columns=lambda c: c[:-len('_원시값')] if c.endswith('_원시값') else c)
+        .melt(id_vars='구분', var_name='회사', value_name='수치')
+    )
+    chart_df['수치'] = pd.to_numeric(chart_df['수치'], errors='coerce')
+    return chart_df
+
 def sort_quarterly_by_quarter(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
-    # '2024Q1' → (연도=2024, 분기=1) 추출해 정렬키 생성
-    out[['연도','분기번호']] = out['분기'].str.extract(r'(\d{4})Q([1-4])').astype(int)
-    out = (out.sort_values(['연도','분기번호','회사'])
-               .drop(columns=['연도','분기번호'])
-               .reset_index(drop=True))
-    return out
-    
+    # 임시 정렬 컬럼을 추가/삭제하지 않고 sort key로 바로 정렬 (원본 복사 없음)
+    return df.sort_values(['분기','회사'], key=_quarter_sort_key).reset_index(drop=True)
+
+# 보고서 바이트 캐시: 입력(DataFrame/인사이트/차트)이 같으면 재생성 없이 이전 결과 반환
+# plotly Figure는 JSON 문자열로 해시 (DataFrame은 streamlit 기본 해시 사용)
+_REPORT_HASH_FUNCS = {"plotly.graph_objs._figure.Figure": lambda fig: fig.to_json()}
+
+@st.cache_data(ttl=3600, show_spinner=False, hash_funcs=_REPORT_HASH_FUNCS)
+def build_pdf_report_cached(financial_data, news_data, insights, quarterly_df, chart_figures,
+                            show_footer, report_target, report_author):
+    return create_enhanced_pdf_report(
+        financial_data=financial_data,
+        news_data=news_data,
+        insights=insights,
+        quarterly_df=quarterly_df,
+        chart_figures=chart_figures,
+        show_footer=show_footer,
+        report_target=report_target,
+        report_author=report_author
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_excel_report_cached(financial_data, news_data, insights):
+    return create_excel_report(financial_data=financial_data, news_data=news_data, insights=insights)
+
 def main():
     initialize_session_state()
     st.title("⚡ SK에너지 경쟁사 분석 대시보드")
@@ -219,18 +257,16 @@ def main():
             final_df = st.session_state.financial_data
             
             # 표시용 컬럼만 표시 (원시값 제외)
-            display_cols = [col for col in final_df.columns if not col.endswith('_원시값')]
+            display_df, raw_cols = split_raw_columns(final_df)
             st.markdown("**📋 정리된 재무지표 (표시값)**")
-            st.dataframe(final_df[display_cols].set_index('구분'), use_container_width=True)
+            st.dataframe(display_df.set_index('구분'), use_container_width=True)
 
             st.markdown("---")
             st.subheader("📊 주요 지표 비교")
             ratio_df = final_df[final_df['구분'].str.contains('%', na=False)]
-            raw_cols = [col for col in final_df.columns if col.endswith('_원시값')]
             
             if not ratio_df.empty and raw_cols:
-                chart_df = pd.melt(ratio_df, id_vars=['구분'], value_vars=raw_cols, var_name='회사', value_name='수치')
-                chart_df['회사'] = chart_df['회사'].str.replace('_원시값', '')
+                chart_df = melt_raw_ratio_columns(ratio_df, raw_cols)
                 
                 if PLOTLY_AVAILABLE:
                     # ✅ 차트 표시 및 디버그 정보
@@ -296,7 +332,7 @@ def main():
             st.markdown("---")
             st.subheader("📈 갭차이 분석")
             final_df = st.session_state.financial_data
-            raw_cols = [col for col in final_df.columns if col.endswith('_원시값')]
+            _, raw_cols = split_raw_columns(final_df)
             
             if raw_cols and len(raw_cols) > 1:
                 gap_analysis = create_gap_analysis(final_df, raw_cols)
@@ -366,18 +402,16 @@ def main():
             final_df = st.session_state.manual_financial_data
             
             # 표시용 컬럼만 표시 (원시값 제외)
-            display_cols = [col for col in final_df.columns if not col.endswith('_원시값')]
+            display_df, raw_cols = split_raw_columns(final_df)
             st.markdown("**📋 정리된 재무지표 (표시값)**")
-            st.dataframe(final_df[display_cols].set_index('구분'), use_container_width=True)
+            st.dataframe(display_df.set_index('구분'), use_container_width=True)
 
             st.markdown("---")
             st.subheader("📊 주요 지표 비교")
             ratio_df = final_df[final_df['구분'].str.contains('%', na=False)]
-            raw_cols = [col for col in final_df.columns if col.endswith('_원시값')]
             
             if not ratio_df.empty and raw_cols:
-                chart_df = pd.melt(ratio_df, id_vars=['구분'], value_vars=raw_cols, var_name='회사', value_name='수치')
-                chart_df['회사'] = chart_df['회사'].str.replace('_원시값', '')
+                chart_df = melt_raw_ratio_columns(ratio_df, raw_cols)
                 
                 if PLOTLY_AVAILABLE:
                     st.plotly_chart(create_sk_bar_chart(chart_df), use_container_width=True, key="manual_bar_chart")
@@ -386,7 +420,6 @@ def main():
             # 갭차이 분석 추가 (완전한 버전)
             st.markdown("---")
             st.subheader("📈 갭차이 분석")
-            raw_cols = [col for col in final_df.columns if col.endswith('_원시값')]
             if raw_cols and len(raw_cols) > 1:
                 gap_analysis = create_gap_analysis(final_df, raw_cols)
                 if not gap_analysis.empty:
@@ -500,12 +533,12 @@ def main():
                     try:
                         if report_format == "PDF":
                             st.info(f"🔄 {len(collected_charts)}개 차트를 포함한 PDF 생성 중...")
-                            file_bytes = create_enhanced_pdf_report(
+                            file_bytes = build_pdf_report_cached(
                                 financial_data=financial_data_for_report,
                                 news_data=st.session_state.news_data,
                                 insights=st.session_state.integrated_insight or st.session_state.financial_insight or st.session_state.news_insight,
                                 quarterly_df=quarterly_df,
-                                selected_charts=collected_charts,  # ✅ 수집된 차트 전달
+                                chart_figures=collected_charts,  # ✅ 수집된 차트 전달
                                 show_footer=show_footer,
                                 report_target=report_target.strip() or "보고 대상 미기재",
                                 report_author=report_author.strip() or "보고자 미기재"
@@ -513,7 +546,7 @@ def main():
                             filename = "SK_Energy_Analysis_Report.pdf"
                             mime_type = "application/pdf"
                         else:
-                            file_bytes = create_excel_report(
+                            file_bytes = build_excel_report_cached(
                                 financial_data=financial_data_for_report,
                                 news_data=st.session_state.news_data,
                                 insights=st.session_state.integrated_insight or st.session_state.financial_insight or st.session_state.news_insight
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+import io
+from decimal import Decimal
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from util import export
+
+
+# --------------------------
+# Excel 보고서
+# --------------------------
+@pytest.mark.parametrize('use_xlsxwriter', [True, False])
+def test_excel_report_writes_unsupported_cells_as_text(monkeypatch, use_xlsxwriter):
+    if use_xlsxwriter and not export.HAS_XLSXWRITER:
+        pytest.skip('xlsxwriter 미설치')
+    monkeypatch.setattr(export, 'HAS_XLSXWRITER', use_xlsxwriter)
+
+    df = pd.DataFrame({
+        '구분': ['매출액', '영업이익'],
+        '분기': [pd.Period('2024Q1'), pd.Period('2024Q2')],
+        '목록': [[1, 2], None],
+        '금액': [Decimal('1.5'), Decimal('2')],
+        '비율': [float('inf'), float('-inf')],
+        '혼합': [1.5, float('inf')],
+    }).astype({'혼합': object})
+    data = export.create_excel_report(financial_data=df)
+
+    wb = openpyxl.load_workbook(io.BytesIO(data))
+    assert '오류정보' not in wb.sheetnames
+    rows = [list(r) for r in wb['재무분석'].iter_rows(values_only=True)]
+    assert rows == [
+        ['구분', '분기', '목록', '금액', '비율', '혼합'],
+        ['매출액', '2024Q1', '[1, 2]', 1.5, 'inf', 1.5],
+        ['영업이익', '2024Q2', None, 2, '-inf', 'inf'],
+    ]
+
+
+# --------------------------
+# 차트 이미지 변환
+# --------------------------
+def _gap_chart():
+    pytest.importorskip('plotly')
+    from visualization.charts import create_gap_chart
+
+    gap_df = pd.DataFrame({
+        '지표': ['영업이익률(%)', '순이익률(%)'],
+        'SK에너지': [8.0, 5.0],
+        'S-Oil_갭(%)': [5.0, -3.2],
+        'GS칼텍스_갭(%)': [-1.5, 2.0],
+    })
+    return create_gap_chart(gap_df)
+
+
+def test_gap_chart_redraw_keeps_labels_baseline_and_annotation():
+    pytest.importorskip('matplotlib')
+    fig = _gap_chart()
+    assert export._is_simple_plotly(fig)
+
+    ax = export._plotly_mpl_figure(fig).axes[0]
+    texts = [t.get_text() for t in ax.texts]
+    assert {'5.0%', '-3.2%', '-1.5%', '2.0%'} <= set(texts)
+    assert 'SK에너지 기준선' in texts
+    assert any(line.get_color() == 'red' and line.get_linestyle() == '--' for line in ax.lines)
+
+    images = export._render_chart_images([fig])
+    assert isinstance(images[0], bytes) and images[0].startswith(b'\x89PNG')
+
+
+def test_unsupported_plotly_elements_are_left_to_kaleido():
+    fig = _gap_chart()
+    fig.add_shape(type='rect', x0=0, x1=1, y0=0, y1=1)
+    assert not export._is_simple_plotly(fig)
+
+    fig = _gap_chart()
+    fig.add_annotation(x=0, y=1, text='화살표')  # showarrow 기본값 True
+    assert not export._is_simple_plotly(fig)
+
+    fig = _gap_chart()
+    fig.update_traces(texttemplate='%{text:.2s}')  # d3 전용 서식
+    assert not export._is_simple_plotly(fig)
+
+
+def test_png_cache_is_safe_under_concurrent_eviction(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(export, 'PLOTLY_PNG_CACHE_SIZE', 2)
+    monkeypatch.setattr(export, '_PLOTLY_PNG_CACHE', export.OrderedDict())
+
+    def _worker(n):
+        for i in range(2000):
+            key = f'k{(n + i) % 5}'
+            if export._png_cache_get(key) is None:
+                export._png_cache_put(key, key.encode())
+        return True
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(_worker, range(8)))
+    assert len(export._PLOTLY_PNG_CACHE) <= 2
+
+
+def test_xlsxwriter_options_turn_inf_numbers_into_error_cells():
+    if not export.HAS_XLSXWRITER:
+        pytest.skip('xlsxwriter 미설치')
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter',
+                        engine_kwargs={'options': export._XLSXWRITER_OPTIONS}) as writer:
+        ws = writer.book.add_worksheet('비율')
+        # 분모가 0인 비율 계산 결과가 숫자 그대로 기록되는 경우
+        ws.write_row(0, 0, [1.0, float('inf'), float('-inf'), float('nan')])
+
+    wb = openpyxl.load_workbook(io.BytesIO(output.getvalue()))
+    assert list(wb['비율'].values) == [(1, '=1/0', '=-1/0', '=#NUM!')]
+
+
+@pytest.mark.parametrize('modify', [
+    lambda fig: fig.update_traces(yaxis='y2', selector=0),
+    lambda fig: fig.update_layout(yaxis2=dict(overlaying='y', side='right')),
+    lambda fig: fig.update_traces(visible=False, selector=0),
+    lambda fig: fig.update_traces(visible='legendonly', selector=0),
+    lambda fig: fig.update_layout(yaxis_ticksuffix='%'),
+    lambda fig: fig.update_layout(yaxis_tickformat='.1%'),
+    lambda fig: fig.update_layout(yaxis_range=[-10, 10]),
+])
+def test_plotly_axis_and_visibility_options_are_left_to_kaleido(modify):
+    fig = _gap_chart()
+    modify(fig)
+    assert not export._is_simple_plotly(fig)
+
+
+def test_category_axis_with_non_string_ticks_is_left_to_kaleido():
+    go = pytest.importorskip('plotly.graph_objects')
+    fig = go.Figure(go.Bar(x=[2023, 2024], y=[1, 2]))
+    assert export._is_simple_plotly(fig)
+    fig.update_layout(xaxis_type='category')
+    assert not export._is_simple_plotly(fig)
+
+
+def test_gap_chart_redraw_strips_glyphs_missing_from_font():
+    pytest.importorskip('matplotlib')
+    if export._mpl_korean_font_family() is None:
+        pytest.skip('한글 글꼴 없음')
+    import warnings
+
+    fig = _gap_chart()
+    fig.update_layout(title_text='📊 갭 차트')
+    fig.data[0].name = '🏭 S-Oil'
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')  # "Glyph ... missing from font" 경고가 나면 실패
+        images = export._render_chart_images([fig])
+    assert images[0].startswith(b'\x89PNG')
+
+    ax = export._plotly_mpl_figure(fig).axes[0]
+    assert '📊' not in ax.get_title() and '갭' in ax.get_title()
+    assert all('🏭' not in t.get_text() for t in ax.get_legend().get_texts())
+
+
+def test_kaleido_not_ready_when_browser_lookup_fails(monkeypatch):
+    chromium = pytest.importorskip('choreographer.browsers.chromium')
+    monkeypatch.setattr(export, 'HAS_KALEIDO', True)
+
+    def _raise(*args, **kwargs):
+        raise RuntimeError('browser lookup failed')
+
+    monkeypatch.setattr(chromium.Chromium, 'find_browser', _raise)
+    export._kaleido_ready.cache_clear()
+    try:
+        assert export._kaleido_ready() is False
+    finally:
+        export._kaleido_ready.cache_clear()
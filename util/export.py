@@ -1,15 +1,24 @@
 # -*- coding: utf-8 -*-
 """
-통합 보고서 생성 모듈 (kaleido/plotly 제거 → matplotlib 기반 차트 삽입)
+통합 보고서 생성 모듈 (matplotlib 기반 차트 삽입, plotly 차트는 kaleido 설치 시 지원)
 필요 패키지: pip install reportlab pandas openpyxl matplotlib
+선택 패키지: pip install plotly kaleido
 """
 
 import io
+import math
 import os
-import sys
-import traceback
+import re
+import importlib.util
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import groupby
+from xml.sax.saxutils import escape
 import pandas as pd
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.platypus import (
@@ -18,7 +27,6 @@ from reportlab.platypus import (
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-import matplotlib.pyplot as plt
 
 # Optional OpenAI (GPT) integration
 try:
@@ -28,42 +36,69 @@ except Exception:
     GPT_AVAILABLE = False
     # print("⚠️ OpenAI 패키지가 없습니다. GPT 기능을 사용하려면 'pip install openai'를 실행하세요.")
 
+# 선택 의존성 (import 시 1회만 확인, 이후에는 플래그만 참조)
+HAS_PLOTLY = importlib.util.find_spec('plotly') is not None
+HAS_KALEIDO = HAS_PLOTLY and importlib.util.find_spec('kaleido') is not None
+HAS_OPENPYXL = importlib.util.find_spec('openpyxl') is not None
+HAS_XLSXWRITER = importlib.util.find_spec('xlsxwriter') is not None
+HAS_MATPLOTLIB = importlib.util.find_spec('matplotlib') is not None
+HAS_LXML = importlib.util.find_spec('lxml') is not None
+
+# 기본 스타일시트 (오류 PDF 등에서 재사용, import 시 1회 생성)
+_DEFAULT_STYLES = getSampleStyleSheet()
+
 
 # --------------------------
 # 폰트 등록 관련 유틸
 # --------------------------
+# 폰트 폴더: SUNI_FONT_DIR 환경변수 우선, 없으면 프로젝트 루트의 'fonts/' (실행 위치와 무관)
+FONT_DIR = os.environ.get(
+    'SUNI_FONT_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fonts'),
+)
+
+
 def get_font_paths():
     """
     환경에 맞춰 실제 ttf 경로를 설정하세요.
-    예: 폰트 파일들을 프로젝트의 'fonts/' 폴더에 넣고 경로를 지정.
+    예: 폰트 파일들을 프로젝트의 'fonts/' 폴더에 넣거나 SUNI_FONT_DIR로 폴더를 지정.
     """
     font_paths = {
-        "Korean": "fonts/NanumGothic.ttf",
-        "KoreanBold": "fonts/NanumGothicBold.ttf",
-        "KoreanSerif": "fonts/NanumMyeongjo.ttf"
+        "Korean": os.path.join(FONT_DIR, "NanumGothic.ttf"),
+        "KoreanBold": os.path.join(FONT_DIR, "NanumGothicBold.ttf"),
+        "KoreanSerif": os.path.join(FONT_DIR, "NanumMyeongjo.ttf")
     }
     # 사용 환경에 맞춰 경로 변경 권장
     return font_paths
 
 
-def register_fonts_safe():
+def register_fonts_safe(font_paths=None):
     """
     안전하게 폰트를 등록하고 사용 가능한 폰트 이름을 반환
     fallback으로 기본 라틴 폰트 사용.
+    font_paths: {'Korean': 경로, ...} (없으면 get_font_paths() 사용)
+    같은 경로 설정이면 등록 결과를 재사용 (보고서마다 ttf를 다시 확인하지 않음)
     """
-    font_paths = get_font_paths()
+    font_items = tuple((font_paths or get_font_paths()).items())
+    return dict(_register_fonts_cached(font_items))
+
+
+@lru_cache(maxsize=4)
+def _register_fonts_cached(font_items):
+    """register_fonts_safe 실제 구현 (font_items: (키, 경로) 튜플, 캐시 키로 사용)"""
     registered_fonts = {}
     default_fonts = {
         "Korean": "Helvetica",
         "KoreanBold": "Helvetica-Bold",
         "KoreanSerif": "Times-Roman"
     }
+    already_registered = set(pdfmetrics.getRegisteredFontNames())
 
-    for key, path in font_paths.items():
+    for key, path in font_items:
         try:
             if os.path.exists(path) and os.path.getsize(path) > 0:
                 name = key
-                if name not in pdfmetrics.getRegisteredFontNames():
+                if name not in already_registered:
                     pdfmetrics.registerFont(TTFont(name, path))
                 registered_fonts[name] = name
                 # print(f"✅ 폰트 등록 성공: {name} -> {path}")
@@ -98,6 +133,29 @@ def safe_str_convert(value):
         return ""
 
 
+def _is_nonempty_df(value):
+    """비어있지 않은 DataFrame인지 확인"""
+    return isinstance(value, pd.DataFrame) and not value.empty
+
+
+# AI 텍스트 정리용 기호/정규식 (모듈 로드 시 1회 생성)
+# 마크다운 강조 기호는 문자 단위 삭제라 정규식 대신 str.replace로 처리
+# (한글 텍스트에서는 str.translate보다도 replace 연쇄가 빠름)
+_MD_STRIP_CHARS = ('*', '_', '~')
+_NUMBERED_TITLE_RE = re.compile(r'^\d+(?:[.:]\s|\))')
+# 마크다운 표 구분선 (|---|:---:|)
+_TABLE_SEPARATOR_RE = re.compile(r'^[\s|:\-]+$')
+
+# 표지 보고 정보 템플릿
+_REPORT_INFO_TMPL = "<b>보고일자:</b> {d}<br/><b>보고대상:</b> {t}<br/><b>보고자:</b> {a}"
+
+
+@lru_cache(maxsize=1)
+def _today_kr(day):
+    """보고일자 문자열 (같은 날짜면 캐시된 값 재사용)"""
+    return day.strftime('%Y년 %m월 %d일')
+
+
 def clean_ai_text(raw):
     """
     AI 인사이트 텍스트 정리 (단순 구현)
@@ -105,77 +163,95 @@ def clean_ai_text(raw):
     인풋에서 '|' 포함 라인은 ASCII 테이블로 간주해서 별도 처리 가능
     """
     try:
-        if not raw or pd.isna(raw):
-            return []
-        raw_str = str(raw).strip()
-        if not raw_str:
-            return []
-
-        # 간단한 마킹 제거
-        import re
-        raw_str = re.sub(r'[*_~]+', '', raw_str)
-        blocks = []
-        for line in raw_str.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            # 제목 판단 (예: 시작에 숫자 또는 '#' 또는 '###' 등)
-            if line.startswith('###') or line.startswith('##') or line.startswith('#'):
-                blocks.append(('title', line.lstrip('#').strip()))
-            elif re.match(r'^\d+(\.|:)\s', line) or re.match(r'^\d+\)', line):
-                blocks.append(('title', line))
-            else:
-                blocks.append(('body', line))
-        return blocks
+        return list(_iter_ai_blocks(raw))
     except Exception as e:
         # print(f"❌ AI 텍스트 정리 오류: {e}")
         return []
 
 
+def _iter_ai_blocks(raw, keep_blank=False):
+    """clean_ai_text의 제너레이터 버전 (중간 리스트 없이 (type, line)을 한 줄씩 생성)
+    keep_blank=True이면 빈 줄을 ('blank', '')로 넘겨 문단 경계로 쓸 수 있게 함"""
+    if not raw or pd.isna(raw):
+        return
+    raw_str = str(raw).strip()
+    if not raw_str:
+        return
+
+    # 간단한 마킹 제거
+    for ch in _MD_STRIP_CHARS:
+        if ch in raw_str:
+            raw_str = raw_str.replace(ch, '')
+    for line in raw_str.splitlines():
+        line = line.strip()
+        if not line:
+            if keep_blank:
+                yield 'blank', ''
+            continue
+        # 제목 판단 (예: 시작에 숫자 또는 '#' 또는 '###' 등)
+        if line.startswith('#'):
+            yield 'title', line.lstrip('#').strip()
+        elif _NUMBERED_TITLE_RE.match(line):
+            yield 'title', line
+        else:
+            yield 'body', line
+
+
 # --------------------------
 # ASCII 표 → reportlab Table
 # --------------------------
+@lru_cache(maxsize=8)
+def _ascii_table_style(header_color, font_bold, font_regular, row_colors=None):
+    """ASCII 표용 TableStyle (같은 색/폰트 조합이면 재사용)"""
+    if row_colors is None:
+        row_colors = (colors.whitesmoke, colors.HexColor('#F7F7F7'))
+    return TableStyle([
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), font_bold),
+        ('FONTNAME', (0, 1), (-1, -1), font_regular),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), list(row_colors)),
+    ])
+
+
 def ascii_to_table(lines, registered_fonts, header_color='#E31E24', row_colors=None):
     """ASCII 표를 reportlab 테이블로 변환"""
     try:
-        if not lines or len(lines) < 1:
+        if not lines or len(lines) < 2:
+            return None
+
+        # 바깥쪽 '|'를 떼고도 열 구분자가 없으면 표가 아님 (문장 속 '|') → split 없이 바로 종료
+        head = lines[0].strip().strip('|')
+        if '|' not in head:
             return None
 
         # 첫 줄을 헤더로 간주
-        header = [c.strip() for c in lines[0].split('|') if c.strip()]
-        if not header:
+        header = [c.strip() for c in head.split('|')]
+        if not any(header):
             return None
 
-        data = []
-        # 이후 줄들을 데이터로 파싱 (빈열 제외)
-        for ln in lines[1:]:
-            cols = [c.strip() for c in ln.split('|') if c.strip() or c == '']
-            # 만약 cols 길이가 header와 다른 경우 유연하게 채움
-            if len(cols) != len(header):
-                # 간단 보정: 짧으면 빈 칸 채우기, 길면 자르기
-                if len(cols) < len(header):
-                    cols.extend([''] * (len(header) - len(cols)))
-                else:
-                    cols = cols[:len(header)]
-            data.append(cols)
+        # 이후 줄들을 한 번에 파싱 (|---|:--:| 구분선은 제외)
+        # 열 개수가 header와 다르면 짧은 행은 빈 칸으로 채우고 긴 행은 자름
+        n_cols = len(header)
+        split_rows = (
+            [c.strip() for c in ln.strip().strip('|').split('|')]
+            for ln in lines[1:] if not _TABLE_SEPARATOR_RE.match(ln)
+        )
+        data = [(cols + [''] * n_cols)[:n_cols] for cols in split_rows]
 
         if not data:
             return None
 
-        if row_colors is None:
-            row_colors = [colors.whitesmoke, colors.HexColor('#F7F7F7')]
-
         tbl = Table([header] + data)
-        tbl.setStyle(TableStyle([
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), registered_fonts.get('KoreanBold', 'Helvetica-Bold')),
-            ('FONTNAME', (0, 1), (-1, -1), registered_fonts.get('Korean', 'Helvetica')),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), row_colors),
-        ]))
+        tbl.setStyle(_ascii_table_style(
+            header_color,
+            registered_fonts.get('KoreanBold', 'Helvetica-Bold'),
+            registered_fonts.get('Korean', 'Helvetica'),
+            tuple(row_colors) if row_colors is not None else None,
+        ))
         return tbl
     except Exception as e:
         # print(f"❌ ASCII 테이블 변환 오류: {e}")
@@ -191,7 +267,7 @@ def split_dataframe_for_pdf(df, max_rows_per_page=20, max_cols_per_page=8):
     각 청크는 dict: {'data': chunk_df, 'row_range':(...), 'col_range':(...)}
     """
     try:
-        if df is None or df.empty:
+        if not _is_nonempty_df(df):
             return []
 
         chunks = []
@@ -225,17 +301,39 @@ def split_dataframe_for_pdf(df, max_rows_per_page=20, max_cols_per_page=8):
 # --------------------------
 # 테이블 추가 함수
 # --------------------------
+@lru_cache(maxsize=8)
+def _chunk_table_style(header_color, font_bold, font_regular):
+    """분할 테이블용 TableStyle (같은 색/폰트 조합이면 재사용)"""
+    return TableStyle([
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
+        ('FONTNAME', (0, 0), (-1, 0), font_bold),
+        ('FONTNAME', (0, 1), (-1, -1), font_regular),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F8F8F8')]),
+    ])
+
+
 def add_chunked_table(story, df, title, registered_fonts, BODY_STYLE, header_color='#F2F2F2'):
     """분할된 테이블을 story에 추가"""
     try:
-        if df is None or df.empty:
+        if not _is_nonempty_df(df):
             story.append(Paragraph(f"{title}: 데이터가 없습니다.", BODY_STYLE))
             return
 
         story.append(Paragraph(title, BODY_STYLE))
         story.append(Spacer(1, 8))
 
-        chunks = split_dataframe_for_pdf(df)
+        # 셀 문자열 변환은 분할 전에 전체 DataFrame에서 한 번에 처리 (결측값은 빈 문자열)
+        df_str = df.astype(object).where(df.notna(), '').astype(str)
+        chunks = split_dataframe_for_pdf(df_str)
+        table_style = _chunk_table_style(
+            header_color,
+            registered_fonts.get('KoreanBold', 'Helvetica-Bold'),
+            registered_fonts.get('Korean', 'Helvetica'),
+        )
 
         for i, chunk_info in enumerate(chunks):
             chunk = chunk_info['data']
@@ -245,21 +343,12 @@ def add_chunked_table(story, df, title, registered_fonts, BODY_STYLE, header_col
                 col_info = f"열 {chunk_info['col_range'][0] + 1}~{chunk_info['col_range'][1] + 1}"
                 story.append(Paragraph(f"[{row_info}, {col_info}]", BODY_STYLE))
 
+            # 모든 셀이 이미 문자열이므로 dtype 추론 없이 object 배열로 바로 변환
             table_data = [chunk.columns.tolist()]
-            for _, row in chunk.iterrows():
-                table_data.append([safe_str_convert(val) for val in row.values])
+            table_data.extend(chunk.to_numpy(dtype=object, copy=False).tolist())
 
             tbl = Table(table_data, repeatRows=1)
-            tbl.setStyle(TableStyle([
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
-                ('FONTNAME', (0, 0), (-1, 0), registered_fonts.get('KoreanBold', 'Helvetica-Bold')),
-                ('FONTNAME', (0, 1), (-1, -1), registered_fonts.get('Korean', 'Helvetica')),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F8F8F8')]),
-            ]))
+            tbl.setStyle(table_style)
 
             story.append(tbl)
             story.append(Spacer(1, 12))
@@ -272,6 +361,400 @@ def add_chunked_table(story, df, title, registered_fonts, BODY_STYLE, header_col
         story.append(Paragraph(f"{title}: 테이블 생성 중 오류가 발생했습니다.", BODY_STYLE))
 
 
+# --------------------------
+# 차트 이미지 변환
+# --------------------------
+# PDF 내 차트 표시 크기(pt)와 해상도 배율 (표시 크기의 2배 픽셀이면 충분히 선명)
+CHART_WIDTH = 500
+CHART_HEIGHT = 300
+CHART_SCALE = 2
+# plotly 일괄 변환 시 동시에 사용할 kaleido 브라우저 탭 최대 개수
+CHART_RENDER_WORKERS = 4
+# PDF 삽입 전 차트 PNG 팔레트 색상 수 (차트는 사용 색이 적어 64색이면 충분)
+CHART_PNG_COLORS = 64
+# plotly Figure JSON 해시 → 변환된 PNG bytes (보고서 재생성 시 같은 차트는 다시 렌더링하지 않음)
+PLOTLY_PNG_CACHE_SIZE = 64
+_PLOTLY_PNG_CACHE = OrderedDict()
+# Streamlit은 세션마다 다른 스레드에서 보고서를 만들 수 있으므로 캐시 조회/갱신은 락 안에서 수행
+_PLOTLY_PNG_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _mpl_korean_font_family():
+    """한글 ttf를 matplotlib에 1회 등록하고 글꼴 이름 반환 (없으면 None)"""
+    from matplotlib import font_manager
+
+    for path in get_font_paths().values():
+        try:
+            if os.path.exists(path) and os.path.getsize(path) > 0:
+                font_manager.fontManager.addfont(path)
+                return font_manager.FontProperties(fname=path).get_name()
+        except Exception:
+            continue
+    return None
+
+
+@lru_cache(maxsize=1)
+def _mpl_font_codepoints():
+    """차트용 한글 글꼴에 글리프가 있는 코드포인트 집합 (글꼴이 없거나 확인 불가 시 None)"""
+    from matplotlib import font_manager
+    from matplotlib.ft2font import FT2Font
+
+    family = _mpl_korean_font_family()
+    if not family:
+        return None
+    try:
+        path = font_manager.findfont(font_manager.FontProperties(family=family), fallback_to_default=False)
+        return frozenset(FT2Font(path).get_charmap())
+    except Exception:
+        return None
+
+
+def _mpl_drawable_text(text, codepoints):
+    """글꼴에 없는 문자(이모지 등)를 제거 - 그대로 두면 네모(□)로 그려짐"""
+    text = '' if text is None else str(text)
+    if codepoints is None:
+        return text
+    return ''.join(ch for ch in text if ch.isspace() or ord(ch) in codepoints).strip()
+
+
+@lru_cache(maxsize=1)
+def _kaleido_ready():
+    """kaleido로 plotly PNG 변환이 가능한지 1회 확인 (kaleido>=1.0은 Chrome 필요)"""
+    if not HAS_KALEIDO:
+        return False
+    try:
+        from choreographer.browsers.chromium import Chromium
+    except ImportError:
+        # kaleido<1.0은 자체 브라우저를 포함하므로 설치만 되어 있으면 사용 가능
+        return True
+    try:
+        return Chromium.find_browser(skip_local=False) is not None
+    except Exception:
+        # Chrome 탐색 실패 시 to_image도 실패하므로 변환 불가로 취급
+        return False
+
+
+# matplotlib 재현 시 지원하는 plotly 요소
+_TEXTTEMPLATE_FIELD_RE = re.compile(r'%\{(text|x|y)(?::([^}]*))?\}')
+_MPL_LINESTYLES = {None: '-', 'solid': '-', 'dash': '--', 'dot': ':', 'dashdot': '-.', 'longdash': '--'}
+_MPL_SIMPLE_REFS = {'x': (None, 'x', 'paper'), 'y': (None, 'y', 'paper')}
+# 보조축/서브플롯 축 (xaxis2, yaxis3 ...) - matplotlib 재현 대상 아님
+_EXTRA_AXIS_RE = re.compile(r'^[xy]axis\d+$')
+
+
+def _simple_texttemplate(template):
+    """%{text:.1f}% 같은 단순 texttemplate인지 확인 (d3 전용 서식이면 False)"""
+    if template is None:
+        return True
+    if not isinstance(template, str):
+        return False
+    for _, spec in _TEXTTEMPLATE_FIELD_RE.findall(template):
+        if spec:
+            try:
+                format(0.0, spec)
+            except (ValueError, TypeError):
+                return False
+    return '%{' not in _TEXTTEMPLATE_FIELD_RE.sub('', template)
+
+
+def _is_simple_plotly(fig):
+    """
+    matplotlib로 재현 가능한 plotly Figure인지 확인
+    - 세로 막대/선(scatter) trace, 막대 값 라벨(text/단순 texttemplate)
+    - 선(line) shape, 화살표 없는 텍스트 annotation
+    그 외 요소(보조축, 숨김 trace, y축 눈금 서식/고정 범위 등)가 있으면 False (kaleido로 변환)
+    """
+    data = getattr(fig, 'data', None)
+    if not data or hasattr(fig, 'savefig'):
+        return False
+    layout = fig.layout
+    if layout.barmode not in (None, 'group'):
+        return False
+    if any(_EXTRA_AXIS_RE.match(key) for key in layout.to_plotly_json()):
+        return False
+    yaxis = layout.yaxis
+    if yaxis.ticksuffix or yaxis.tickformat or yaxis.range is not None:
+        return False
+    for trace in data:
+        if trace.type not in ('bar', 'scatter') or trace.x is None or trace.y is None:
+            return False
+        if trace.visible in (False, 'legendonly') or trace.yaxis not in (None, 'y') or trace.xaxis not in (None, 'x'):
+            return False
+        if layout.xaxis.type == 'category' and not all(isinstance(x, str) for x in trace.x):
+            return False
+        if trace.type == 'bar':
+            if trace.orientation == 'h' or not _simple_texttemplate(trace.texttemplate):
+                return False
+        elif 'text' in (trace.mode or ''):
+            return False
+    for shape in layout.shapes:
+        if shape.type != 'line' or shape.xref not in _MPL_SIMPLE_REFS['x'] or shape.yref not in _MPL_SIMPLE_REFS['y']:
+            return False
+    for ann in layout.annotations:
+        if ann.showarrow is not False or '<' in (ann.text or ''):
+            return False
+        if ann.xref not in _MPL_SIMPLE_REFS['x'] or ann.yref not in _MPL_SIMPLE_REFS['y']:
+            return False
+    return True
+
+
+def _bar_labels(trace):
+    """막대 trace의 값 라벨 목록 (text/texttemplate 기준, 표시하지 않으면 None)"""
+    if trace.textposition == 'none' or (trace.text is None and trace.texttemplate is None):
+        return None
+    n = len(trace.y)
+    texts = trace.text
+    if texts is None or isinstance(texts, str):
+        texts = [texts] * n
+    template = trace.texttemplate
+    if template is None:
+        return ['' if t is None else str(t) for t in texts]
+
+    def _render(t, x, y):
+        values = {'text': t, 'x': x, 'y': y}
+
+        def _field(m):
+            value = values[m.group(1)]
+            try:
+                return format(value, m.group(2)) if m.group(2) else str(value)
+            except (ValueError, TypeError):
+                return str(value)
+        return _TEXTTEMPLATE_FIELD_RE.sub(_field, template)
+
+    return [_render(t, x, y) for t, x, y in zip(texts, trace.x, trace.y)]
+
+
+def _plotly_mpl_figure(fig, width=CHART_WIDTH, height=CHART_HEIGHT, scale=CHART_SCALE):
+    """
+    단순 plotly 막대/선 Figure를 matplotlib Figure로 다시 그림 (값 라벨, 기준선, 주석 포함)
+    - 제목/범례/주석의 이모지처럼 한글 글꼴로 그릴 수 없는 문자는 제거
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.transforms import blended_transform_factory
+
+    mfig = Figure(figsize=(width / 100, height / 100), dpi=100 * scale)
+    FigureCanvasAgg(mfig)
+    ax = mfig.add_subplot()
+    codepoints = _mpl_font_codepoints()
+
+    def _text(value):
+        return _mpl_drawable_text(value, codepoints)
+
+    # x값은 범주로 취급 (지표명, 분기 등) - 등장 순서대로 위치 부여 (plotly 범주축과 같은 0, 1, 2 ...)
+    categories = list(dict.fromkeys(x for trace in fig.data for x in trace.x))
+    pos = {c: i for i, c in enumerate(categories)}
+    bars = [t for t in fig.data if t.type == 'bar']
+    bar_width = 0.8 / max(len(bars), 1)
+
+    for j, trace in enumerate(bars):
+        color = trace.marker.color if isinstance(trace.marker.color, str) else None
+        xs = [pos[x] - 0.4 + bar_width * (j + 0.5) for x in trace.x]
+        container = ax.bar(xs, list(trace.y), width=bar_width, label=_text(trace.name) or None, color=color)
+        labels = _bar_labels(trace)
+        if labels:
+            label_type = 'center' if trace.textposition == 'inside' else 'edge'
+            ax.bar_label(container, labels=[_text(v) for v in labels], label_type=label_type, padding=2, fontsize=7)
+    if bars:
+        ax.axhline(0, color='gray', linewidth=0.8)
+
+    for trace in fig.data:
+        if trace.type != 'scatter':
+            continue
+        color = trace.line.color if isinstance(trace.line.color, str) else None
+        marker = 'o' if 'markers' in (trace.mode or 'lines+markers') else None
+        ax.plot([pos[x] for x in trace.x], list(trace.y), marker=marker, label=_text(trace.name) or None, color=color)
+
+    def _coord(value, ref):
+        return pos.get(value, value) if ref != 'paper' else value
+
+    def _transform(xref, yref):
+        return blended_transform_factory(
+            ax.transAxes if xref == 'paper' else ax.transData,
+            ax.transAxes if yref == 'paper' else ax.transData,
+        )
+
+    for shape in fig.layout.shapes:
+        ax.plot(
+            [_coord(shape.x0, shape.xref), _coord(shape.x1, shape.xref)],
+            [_coord(shape.y0, shape.yref), _coord(shape.y1, shape.yref)],
+            transform=_transform(shape.xref, shape.yref),
+            color=shape.line.color or 'black', linewidth=shape.line.width or 1,
+            linestyle=_MPL_LINESTYLES.get(shape.line.dash, '--'),
+        )
+    for ann in fig.layout.annotations:
+        ax.text(
+            _coord(ann.x, ann.xref), _coord(ann.y, ann.yref), _text(ann.text),
+            transform=_transform(ann.xref, ann.yref), ha='center', va='bottom',
+            color=ann.font.color, fontsize=ann.font.size or 10,
+        )
+
+    ax.set_xticks(range(len(categories)))
+    ax.set_xticklabels([_text(c) for c in categories])
+    ax.set_title(_text(fig.layout.title.text))
+    ax.set_xlabel(_text(fig.layout.xaxis.title.text))
+    ax.set_ylabel(_text(fig.layout.yaxis.title.text))
+    if any(t.name for t in fig.data):
+        ax.legend(fontsize=8)
+    ax.grid(axis='y', alpha=0.3)
+    return mfig
+
+
+def _plotly_to_png_mpl(fig, width=CHART_WIDTH, height=CHART_HEIGHT, scale=CHART_SCALE):
+    """단순 plotly 막대/선 Figure를 matplotlib로 다시 그려 PNG bytes 반환 (kaleido/브라우저 불필요)"""
+    import matplotlib
+
+    rc = {'axes.unicode_minus': False}
+    family = _mpl_korean_font_family()
+    if family:
+        rc['font.family'] = family
+
+    with matplotlib.rc_context(rc):
+        mfig = _plotly_mpl_figure(fig, width, height, scale)
+        img_buffer = io.BytesIO()
+        mfig.savefig(img_buffer, format='png', bbox_inches='tight')
+    return img_buffer.getvalue()
+
+
+def _fig_to_png_bytes(fig, width=CHART_WIDTH, height=CHART_HEIGHT, scale=CHART_SCALE):
+    """
+    차트 Figure를 PNG bytes로 변환 (변환 불가 시 None)
+    - matplotlib: width * scale 픽셀을 넘지 않도록 dpi를 제한
+    - plotly(막대/선): matplotlib로 다시 그려 변환 (kaleido 불필요)
+    - plotly(그 외): kaleido(와 Chrome)를 쓸 수 있는 경우에만 to_image로 변환
+    """
+    if not hasattr(fig, 'savefig'):
+        if _is_simple_plotly(fig):
+            return _plotly_to_png_mpl(fig, width, height, scale)
+        if not _kaleido_ready() or not hasattr(fig, 'to_image'):
+            return None
+        return fig.to_image(format='png', width=width, height=height, scale=scale)
+
+    fig_width_in = fig.get_figwidth() or 1
+    dpi = min(fig.dpi, width * scale / fig_width_in)
+    img_buffer = io.BytesIO()
+    fig.savefig(img_buffer, format='png', dpi=dpi, bbox_inches='tight')
+    return img_buffer.getvalue()
+
+
+def _compress_png(png_bytes, n_colors=CHART_PNG_COLORS):
+    """PNG를 팔레트(n_colors색)로 양자화해 용량 축소 (실패하거나 더 커지면 원본 반환)"""
+    try:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(png_bytes)) as im:
+            quantized = im.convert('RGB').quantize(colors=n_colors, method=Image.Quantize.FASTOCTREE)
+        out = io.BytesIO()
+        quantized.save(out, format='PNG', optimize=True)
+        compressed = out.getvalue()
+        return compressed if len(compressed) < len(png_bytes) else png_bytes
+    except Exception:
+        return png_bytes
+
+
+def _render_plotly_batch(figs):
+    """kaleido(>=1.0) 브라우저 세션 하나에서 여러 탭으로 plotly Figure들을 동시에 PNG 변환 (입력 순서 유지)"""
+    import asyncio
+    import kaleido
+
+    opts = dict(format='png', width=CHART_WIDTH, height=CHART_HEIGHT, scale=CHART_SCALE)
+
+    async def _run():
+        async with kaleido.Kaleido(n=min(CHART_RENDER_WORKERS, len(figs))) as k:
+            return await asyncio.gather(*(k.calc_fig(fig, opts=opts) for fig in figs))
+
+    return asyncio.run(_run())
+
+
+def _plotly_cache_key(fig):
+    """plotly Figure 내용 기준 캐시 키 (JSON 직렬화 실패 시 None)"""
+    try:
+        return hashlib.sha1(fig.to_json().encode('utf-8')).hexdigest()
+    except Exception:
+        return None
+
+
+def _png_cache_get(key):
+    """캐시된 PNG bytes 반환 (없으면 None), 조회한 키는 최근 사용으로 갱신"""
+    with _PLOTLY_PNG_CACHE_LOCK:
+        img = _PLOTLY_PNG_CACHE.get(key)
+        if img is not None:
+            _PLOTLY_PNG_CACHE.move_to_end(key)
+        return img
+
+
+def _png_cache_put(key, img):
+    """PNG bytes를 캐시에 저장하고 최대 개수를 넘으면 가장 오래된 항목 제거"""
+    with _PLOTLY_PNG_CACHE_LOCK:
+        _PLOTLY_PNG_CACHE[key] = img
+        _PLOTLY_PNG_CACHE.move_to_end(key)
+        while len(_PLOTLY_PNG_CACHE) > PLOTLY_PNG_CACHE_SIZE:
+            _PLOTLY_PNG_CACHE.popitem(last=False)
+
+
+def _render_chart_images(chart_figures):
+    """
+    차트 Figure 목록을 PNG bytes 목록으로 일괄 변환 (입력 순서 유지)
+    같은 Figure 객체가 여러 번 들어 있으면 한 번만 변환해 결과를 공유
+    plotly Figure가 여러 개면 브라우저를 한 번만 띄워 함께 변환 (실패 시 개별 변환)
+    변환된 PNG는 팔레트로 양자화해 PDF 용량을 줄임
+    plotly Figure는 내용(JSON) 기준으로 변환 결과를 캐시해 재생성 시 다시 렌더링하지 않음
+    각 항목은 bytes, None(변환 불가) 또는 변환 중 발생한 Exception
+    """
+    figs = list({id(fig): fig for fig in chart_figures}.values())
+    images = [None] * len(figs)
+    rendered = set()
+
+    cache_keys = {
+        i: _plotly_cache_key(fig) for i, fig in enumerate(figs)
+        if not hasattr(fig, 'savefig') and hasattr(fig, 'to_json')
+    }
+    cached = set()
+    for i, key in cache_keys.items():
+        img = _png_cache_get(key) if key else None
+        if img is not None:
+            images[i] = img
+            cached.add(i)
+    rendered.update(cached)
+
+    plotly_idx = [
+        i for i, fig in enumerate(figs)
+        if i not in rendered and not hasattr(fig, 'savefig') and not _is_simple_plotly(fig)
+    ]
+    if _kaleido_ready() and len(plotly_idx) > 1:
+        try:
+            pngs = _render_plotly_batch([figs[i] for i in plotly_idx])
+            for i, png in zip(plotly_idx, pngs):
+                images[i] = png
+            rendered.update(plotly_idx)
+        except Exception:
+            # kaleido<1.0, 실행 중인 이벤트 루프 등 → 개별 to_image로 재시도
+            pass
+
+    for i, fig in enumerate(figs):
+        try:
+            if i not in rendered:
+                images[i] = _fig_to_png_bytes(fig)
+        except Exception as e:
+            images[i] = e
+        finally:
+            if hasattr(fig, 'savefig'):
+                # pyplot은 import 비용이 커서 matplotlib Figure를 닫을 때만 로드
+                import matplotlib.pyplot as plt
+                plt.close(fig)
+
+    for i, img in enumerate(images):
+        if i in cached or not isinstance(img, bytes):
+            continue  # 캐시에서 가져온 이미지는 이미 압축됨
+        images[i] = img = _compress_png(img)
+        if cache_keys.get(i):
+            _png_cache_put(cache_keys[i], img)
+
+    image_by_id = {id(fig): img for fig, img in zip(figs, images)}
+    return [image_by_id[id(fig)] for fig in chart_figures]
+
+
 # --------------------------
 # 재무분석 섹션 (matplotlib figure 추가)
 # --------------------------
@@ -281,7 +764,7 @@ def add_financial_data_section(story, financial_data, quarterly_df, chart_figure
         story.append(Paragraph("1. 재무분석 결과", HEADING_STYLE))
 
         # 1-1. 분기별 재무지표 상세 데이터
-        if quarterly_df is not None and not quarterly_df.empty:
+        if _is_nonempty_df(quarterly_df):
             add_chunked_table(story, quarterly_df, "1-1. 분기별 재무지표 상세 데이터",
                              registered_fonts, BODY_STYLE, '#E6F3FF')
         else:
@@ -290,33 +773,43 @@ def add_financial_data_section(story, financial_data, quarterly_df, chart_figure
         story.append(Spacer(1, 12))
 
         # 1-2. SK에너지 대비 경쟁사 갭차이 분석표
-        if financial_data is not None and not financial_data.empty:
-            display_cols = [c for c in financial_data.columns if not str(c).endswith('_원시값')]
-            df_display = financial_data[display_cols].copy()
+        if _is_nonempty_df(financial_data):
+            raw_mask = financial_data.columns.astype(str).str.endswith('_원시값')
+            df_display = financial_data.loc[:, ~raw_mask]
             add_chunked_table(story, df_display, "1-2. SK에너지 대비 경쟁사 갭차이 분석",
                              registered_fonts, BODY_STYLE, '#F2F2F2')
         else:
             story.append(Paragraph("1-2. SK에너지 대비 경쟁사 갭차이 분석: 데이터가 없습니다.", BODY_STYLE))
 
         # 1-3. matplotlib 차트 이미지들 추가
-        if chart_figures and len(chart_figures) > 0:
+        # 생성되지 않은(None) 차트는 번호를 매기기 전에 제외
+        chart_figures = [fig for fig in (chart_figures or []) if fig is not None]
+        if chart_figures:
             story.append(Spacer(1, 12))
             story.append(Paragraph("1-3. 시각화 차트", BODY_STYLE))
             story.append(Spacer(1, 8))
 
-            for i, fig in enumerate(chart_figures, 1):
+            chart_images = _render_chart_images(chart_figures)
+            unsupported = []
+            for i, img_bytes in enumerate(chart_images, 1):
                 try:
-                    img_buffer = io.BytesIO()
-                    fig.savefig(img_buffer, format='png', bbox_inches='tight')
-                    plt.close(fig)
-                    img_buffer.seek(0)
+                    if isinstance(img_bytes, Exception):
+                        raise img_bytes
+                    if img_bytes is None:
+                        unsupported.append(str(i))
+                        continue
 
                     story.append(Paragraph(f"차트 {i}", BODY_STYLE))
-                    img = RLImage(img_buffer, width=500, height=300)
+                    img = RLImage(io.BytesIO(img_bytes), width=CHART_WIDTH, height=CHART_HEIGHT)
                     story.append(img)
                     story.append(Spacer(1, 16))
                 except Exception as e:
                     story.append(Paragraph(f"차트 {i}: 이미지 생성 실패 ({e})", BODY_STYLE))
+            if unsupported:
+                # 변환 불가 차트는 차트마다 문구를 넣지 않고 한 번에 안내
+                story.append(Paragraph(
+                    f"차트 {', '.join(unsupported)}: 이미지 변환 불가 (kaleido/Chrome 미설치)", BODY_STYLE
+                ))
         else:
             # 차트가 없을 때 안내 문구만 추가 (선택)
             story.append(Paragraph("시각화 차트가 제공되지 않았습니다.", BODY_STYLE))
@@ -330,6 +823,34 @@ def add_financial_data_section(story, financial_data, quarterly_df, chart_figure
 # --------------------------
 # AI 인사이트 섹션
 # --------------------------
+def _body_paragraph(lines, BODY_STYLE):
+    """본문 줄들을 escape 후 <br/>로 이어 하나의 Paragraph로 생성 ('<', '&'가 마크업 파서를 깨지 않도록)"""
+    return Paragraph('<br/>'.join(escape(line) for line in lines), BODY_STYLE)
+
+
+def _title_paragraph(line, BODY_STYLE):
+    return Paragraph(f"<b>{escape(line)}</b>", BODY_STYLE)
+
+
+def _ai_block_paragraphs(blocks, BODY_STYLE):
+    """(타입, 줄) 블록을 Paragraph로 변환 - 빈 줄/제목 사이의 연속된 본문 줄은 하나의 문단으로 생성"""
+    for typ, group in groupby(blocks, key=lambda b: b[0]):
+        if typ == 'blank':
+            continue
+        lines = [line for _, line in group]
+        if typ == 'title':
+            for line in lines:
+                yield _title_paragraph(line, BODY_STYLE)
+        else:
+            yield _body_paragraph(lines, BODY_STYLE)
+
+
+def _append_ascii_block(story, lines, registered_fonts, header_color, BODY_STYLE):
+    """'|' 포함 줄 묶음을 표로 추가 (표 형식이 아니면 본문 문단으로 추가)"""
+    tbl = ascii_to_table(lines, registered_fonts, header_color)
+    story.append(tbl if tbl else _body_paragraph(lines, BODY_STYLE))
+
+
 def add_ai_insights_section(story, insights, registered_fonts, BODY_STYLE, header_color='#E31E24'):
     """AI 인사이트 섹션 추가"""
     try:
@@ -339,33 +860,52 @@ def add_ai_insights_section(story, insights, registered_fonts, BODY_STYLE, heade
             return
 
         story.append(Spacer(1, 8))
-        blocks = clean_ai_text(insights)
+        # 줄 단위로 분류하면서 바로 flowable 생성 (블록 리스트를 따로 만들지 않음)
+        blocks = _iter_ai_blocks(insights, keep_blank=True)
+
+        # 텍스트 전체에 '|'가 없으면 표 판별/버퍼링 없이 바로 문단 생성
+        if '|' not in str(insights):
+            story.extend(_ai_block_paragraphs(blocks, BODY_STYLE))
+            story.append(Spacer(1, 18))
+            return
+
         ascii_buffer = []
+        body_buffer = []
+        # 인사이트 줄 수만큼 반복되는 루프이므로 append 메서드를 지역 변수로 바인딩
+        _append = story.append
 
         for typ, line in blocks:
             # ASCII 표 라인 포함판단 (파이프 포함)
             if '|' in line:
+                if body_buffer:
+                    _append(_body_paragraph(body_buffer, BODY_STYLE))
+                    body_buffer.clear()
                 ascii_buffer.append(line)
                 continue
 
             if ascii_buffer:
-                tbl = ascii_to_table(ascii_buffer, registered_fonts, header_color)
-                if tbl:
-                    story.append(tbl)
-                story.append(Spacer(1, 12))
+                _append_ascii_block(story, ascii_buffer, registered_fonts, header_color, BODY_STYLE)
+                _append(Spacer(1, 12))
                 ascii_buffer.clear()
 
+            if typ == 'body':
+                body_buffer.append(line)
+                continue
+
+            # 제목/빈 줄에서 본문 문단 마감
+            if body_buffer:
+                _append(_body_paragraph(body_buffer, BODY_STYLE))
+                body_buffer.clear()
             if typ == 'title':
-                story.append(Paragraph(f"<b>{line}</b>", BODY_STYLE))
-            else:
-                story.append(Paragraph(line, BODY_STYLE))
+                _append(_title_paragraph(line, BODY_STYLE))
+
+        if body_buffer:
+            _append(_body_paragraph(body_buffer, BODY_STYLE))
 
         if ascii_buffer:
-            tbl = ascii_to_table(ascii_buffer, registered_fonts, header_color)
-            if tbl:
-                story.append(tbl)
+            _append_ascii_block(story, ascii_buffer, registered_fonts, header_color, BODY_STYLE)
 
-        story.append(Spacer(1, 18))
+        _append(Spacer(1, 18))
     except Exception as e:
         # print(f"❌ AI 인사이트 섹션 추가 오류: {e}")
         pass
@@ -425,11 +965,7 @@ def add_strategic_recommendations_section(story, recommendations, registered_fon
             # 그냥 전체 텍스트로 삽입
             story.append(Paragraph(recommendations, BODY_STYLE))
         else:
-            for typ, line in blocks:
-                if typ == 'title':
-                    story.append(Paragraph(f"<b>{line}</b>", BODY_STYLE))
-                else:
-                    story.append(Paragraph(line, BODY_STYLE))
+            story.extend(_ai_block_paragraphs(blocks, BODY_STYLE))
 
         story.append(Spacer(1, 18))
     except Exception as e:
@@ -443,10 +979,16 @@ def add_strategic_recommendations_section(story, recommendations, registered_fon
 def add_news_section(story, news_data, insights, registered_fonts, HEADING_STYLE, BODY_STYLE):
     """뉴스 하이라이트 및 종합 분석 섹션 내용 추가 (헤딩 제외)"""
     try:
-        if news_data is not None and not news_data.empty:
+        if _is_nonempty_df(news_data):
             story.append(Paragraph("4-1. 최신 뉴스 하이라이트", BODY_STYLE))
-            for i, title in enumerate(news_data.get("제목", news_data.columns[0]).head(10), 1):
-                story.append(Paragraph(f"{i}. {safe_str_convert(title)}", BODY_STYLE))
+            title_col = "제목" if "제목" in news_data.columns else news_data.columns[0]
+            # 결측값/문자열 변환은 pandas에서 한 번에 처리하고, 제목 목록은 <br/>로 이어 Paragraph 하나로 생성
+            # (&, < 등이 태그로 해석되지 않도록 escape)
+            titles = news_data[title_col].head(10).fillna('').astype(str)
+            story.append(Paragraph(
+                "<br/>".join(f"{i}. {escape(title)}" for i, title in enumerate(titles, 1)),
+                BODY_STYLE,
+            ))
             story.append(Spacer(1, 16))
         else:
             story.append(Paragraph("뉴스 데이터가 제공되지 않았습니다.", BODY_STYLE))
@@ -460,51 +1002,191 @@ def add_news_section(story, news_data, insights, registered_fonts, HEADING_STYLE
 # --------------------------
 # Excel 보고서 생성
 # --------------------------
+# xlsxwriter 스트리밍 옵션 (행 단위로 바로 XML 기록, 문자열 자동 변환 없음, 날짜는 표시 형식 지정)
+_XLSXWRITER_OPTIONS = {
+    'constant_memory': True,
+    # NaN/inf 숫자가 기록 경로에 남아 있어도 예외 대신 Excel 오류 셀(#NUM!, =1/0 → #DIV/0!)로 기록
+    'nan_inf_to_errors': True,
+    'strings_to_urls': False,
+    'strings_to_numbers': False,
+    'remove_timezone': True,
+    'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+}
+
+
+# xlsxwriter/openpyxl이 그대로 기록할 수 있는 셀 값 타입 (그 외는 문자열로 기록)
+_EXCEL_CELL_TYPES = (str, int, float, bool, datetime, date, Decimal)
+
+
+def _excel_cell(value):
+    """
+    엔진이 지원하지 않는 셀 값(Period, list 등)을 str()로 변환
+    pandas ExcelWriter._value_with_fmt와 같은 기준 (numpy 스칼라는 파이썬 숫자로)
+    ±inf는 to_excel의 inf_rep 기본값처럼 'inf'/'-inf' 문자열로 기록 (엔진은 숫자로 쓰지 못함)
+    """
+    if value is None:
+        return None
+    if isinstance(value, float) or pd.api.types.is_float(value):
+        value = float(value)
+        if math.isinf(value):
+            return '-inf' if value < 0 else 'inf'
+        return value
+    if isinstance(value, Decimal) and value.is_infinite():
+        return '-inf' if value < 0 else 'inf'
+    if isinstance(value, _EXCEL_CELL_TYPES):
+        return value
+    if pd.api.types.is_integer(value):
+        return int(value)
+    if pd.api.types.is_bool(value):
+        return bool(value)
+    return str(value)
+
+
+def _excel_rows(df):
+    """
+    DataFrame 행을 기록용 튜플로 생성 (결측값은 None)
+    숫자/불리언/날짜 dtype 컬럼은 그대로 두고, 그 외 컬럼과 ±inf가 있는 실수 컬럼 값만 _excel_cell로 변환
+    """
+    rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+    convert_idx = [
+        i for i, dtype in enumerate(df.dtypes)
+        if not (pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype))
+        or (pd.api.types.is_float_dtype(dtype) and df.iloc[:, i].abs().eq(math.inf).any())
+    ]
+    if not convert_idx:
+        yield from rows
+        return
+    for row in rows:
+        row = list(row)
+        for i in convert_idx:
+            row[i] = _excel_cell(row[i])
+        yield row
+
+
+def _write_sheet(writer, df, sheet_name):
+    """
+    DataFrame 값을 시트에 행 단위로 직접 기록
+    pandas to_excel의 셀 단위 dtype/스타일 처리를 거치지 않음 (결측값은 빈 셀)
+    엔진이 기록할 수 없는 값(Period, list 등)은 to_excel과 같이 문자열로 기록
+    """
+    header = [str(c) for c in df.columns]
+    rows = _excel_rows(df)
+    if writer.engine == 'xlsxwriter':
+        ws = writer.book.add_worksheet(sheet_name)
+        ws.write_row(0, 0, header)
+        for r, row in enumerate(rows, start=1):
+            ws.write_row(r, 0, row)
+    else:
+        ws = writer.book.create_sheet(sheet_name)
+        ws.append(header)
+        for row in rows:
+            ws.append(row)
+
+
+def _excel_writer_kwargs():
+    """
+    pd.ExcelWriter 엔진 설정
+    값만 행 순서대로 기록하므로 셀 객체를 메모리에 쌓지 않는 스트리밍 모드 사용
+    (xlsxwriter constant_memory 우선, 없으면 openpyxl write_only)
+    """
+    if HAS_XLSXWRITER:
+        return dict(engine='xlsxwriter', engine_kwargs={'options': _XLSXWRITER_OPTIONS})
+    return dict(engine='openpyxl', engine_kwargs={'write_only': True})
+
+
 def create_excel_report(financial_data=None, news_data=None, insights=None):
     """Excel 보고서 생성"""
     try:
         output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            if financial_data is not None and not financial_data.empty:
-                financial_data.to_excel(writer, sheet_name='재무분석', index=False)
+        with pd.ExcelWriter(output, **_excel_writer_kwargs()) as writer:
+            if _is_nonempty_df(financial_data):
+                _write_sheet(writer, financial_data, '재무분석')
             else:
-                pd.DataFrame({'메모': ['재무 데이터가 없습니다.']}).to_excel(writer, sheet_name='재무분석', index=False)
+                _write_sheet(writer, pd.DataFrame({'메모': ['재무 데이터가 없습니다.']}), '재무분석')
 
-            if news_data is not None and not news_data.empty:
-                news_data.to_excel(writer, sheet_name='뉴스분석', index=False)
+            if _is_nonempty_df(news_data):
+                _write_sheet(writer, news_data, '뉴스분석')
             else:
-                pd.DataFrame({'메모': ['뉴스 데이터가 없습니다.']}).to_excel(writer, sheet_name='뉴스분석', index=False)
+                _write_sheet(writer, pd.DataFrame({'메모': ['뉴스 데이터가 없습니다.']}), '뉴스분석')
 
             if insights:
                 insight_lines = str(insights).split('\n')
-                insight_df = pd.DataFrame({'AI 인사이트': insight_lines})
-                insight_df.to_excel(writer, sheet_name='AI인사이트', index=False)
+                _write_sheet(writer, pd.DataFrame({'AI 인사이트': insight_lines}), 'AI인사이트')
             else:
-                pd.DataFrame({'메모': ['AI 인사이트가 없습니다.']}).to_excel(writer, sheet_name='AI인사이트', index=False)
+                _write_sheet(writer, pd.DataFrame({'메모': ['AI 인사이트가 없습니다.']}), 'AI인사이트')
 
-        output.seek(0)
         return output.getvalue()
 
     except Exception as e:
         output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        with pd.ExcelWriter(output, **_excel_writer_kwargs()) as writer:
             error_df = pd.DataFrame({
                 '오류': [f"Excel 생성 중 오류 발생: {str(e)}"],
                 '해결방법': ['시스템 관리자에게 문의해주세요.']
             })
-            error_df.to_excel(writer, sheet_name='오류정보', index=False)
-        output.seek(0)
+            _write_sheet(writer, error_df, '오류정보')
         return output.getvalue()
 
 
 # --------------------------
-# PDF 보고서 생성 (메인)
+# PDF 문서 템플릿
 # --------------------------
-def create_enhanced_pdf_report(
+def _page_number(canvas, doc):
+    """페이지 하단 중앙에 페이지 번호 표시"""
+    try:
+        canvas.setFont('Helvetica', 9)
+        canvas.drawCentredString(A4[0] / 2, 20, f"- {canvas.getPageNumber()} -")
+    except Exception:
+        pass
+
+
+@lru_cache(maxsize=4)
+def _report_styles(font_bold, font_serif):
+    """보고서 제목/헤딩/본문 스타일 (폰트 조합별로 1회만 생성해 재사용)"""
+    title_style = ParagraphStyle(
+        'Title',
+        fontName=font_bold,
+        fontSize=20,
+        leading=30,
+        spaceAfter=15,
+        alignment=1,
+    )
+    heading_style = ParagraphStyle(
+        'Heading',
+        fontName=font_bold,
+        fontSize=14,
+        leading=23,
+        textColor=colors.HexColor('#E31E24'),
+        spaceBefore=16,
+        spaceAfter=10,
+    )
+    body_style = ParagraphStyle(
+        'Body',
+        fontName=font_serif,
+        fontSize=12,
+        leading=18,
+        spaceAfter=6,
+    )
+    return title_style, heading_style, body_style
+
+
+def _make_doc(buffer):
+    """보고서 공통 여백의 A4 문서 템플릿 생성 (전역 rl_config 설정과 무관하게 페이지 스트림 zlib 압축)"""
+    return SimpleDocTemplate(
+        buffer, pagesize=A4, leftMargin=40, rightMargin=40, topMargin=40, bottomMargin=40,
+        pageCompression=1,
+    )
+
+
+# --------------------------
+# PDF 보고서 생성 (스트리밍)
+# --------------------------
+def stream_enhanced_pdf_report(
+    response_writer,
     financial_data=None,
     news_data=None,
     insights=None,
-    chart_figures=None,  # matplotlib Figure 리스트
+    chart_figures=None,  # matplotlib (또는 plotly) Figure 리스트
     quarterly_df=None,
     show_footer=False,
     report_target="SK이노베이션 경영진",
@@ -512,89 +1194,97 @@ def create_enhanced_pdf_report(
     gpt_api_key=None,
     font_paths=None,
 ):
-    """향상된 PDF 보고서 생성 (matplotlib 차트 직접 삽입)"""
-    try:
-        registered_fonts = register_fonts_safe()
-
-        TITLE_STYLE = ParagraphStyle(
-            'Title',
-            fontName=registered_fonts.get('KoreanBold', 'Helvetica-Bold'),
-            fontSize=20,
-            leading=30,
-            spaceAfter=15,
-            alignment=1,
-        )
-        HEADING_STYLE = ParagraphStyle(
-            'Heading',
-            fontName=registered_fonts.get('KoreanBold', 'Helvetica-Bold'),
-            fontSize=14,
-            leading=23,
-            textColor=colors.HexColor('#E31E24'),
-            spaceBefore=16,
-            spaceAfter=10,
-        )
-        BODY_STYLE = ParagraphStyle(
-            'Body',
-            fontName=registered_fonts.get('KoreanSerif', 'Times-Roman'),
-            fontSize=12,
-            leading=18,
-            spaceAfter=6,
-        )
+    """
+    PDF 보고서를 파일형 객체(response_writer)에 바로 기록
+    response_writer: write()를 지원하는 객체 (BytesIO, SpooledTemporaryFile, HTTP 응답 스트림 등)
+    중간 버퍼 복사 없이 기록하므로 오류 발생 시 예외를 그대로 전달 (fallback PDF 없음)
+    """
+    registered_fonts = register_fonts_safe(font_paths)
+    TITLE_STYLE, HEADING_STYLE, BODY_STYLE = _report_styles(
+        registered_fonts.get('KoreanBold', 'Helvetica-Bold'),
+        registered_fonts.get('KoreanSerif', 'Times-Roman'),
+    )
 
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, leftMargin=40, rightMargin=40, topMargin=40, bottomMargin=40)
-
-        story = []
-
-        # 표지
-        story.append(Paragraph("손익개선을 위한 SK에너지 및 경쟁사 비교 분석 보고서", TITLE_STYLE))
-        story.append(Spacer(1, 20))
-
-        report_info = f"""
-        <b>보고일자:</b> {datetime.now().strftime('%Y년 %m월 %d일')}<br/>
-        <b>보고대상:</b> {safe_str_convert(report_target)}<br/>
-        <b>보고자:</b> {safe_str_convert(report_author)}
-        """
-        story.append(Paragraph(report_info, BODY_STYLE))
-        story.append(Spacer(1, 30))
-
-        # 1. 재무분석 결과 (표 + 차트 이미지)
-        add_financial_data_section(story, financial_data, quarterly_df, chart_figures,
-                                   registered_fonts, HEADING_STYLE, BODY_STYLE)
-
-        # 2. AI 인사이트
-        story.append(Paragraph("2. AI 분석 인사이트", HEADING_STYLE))
-        add_ai_insights_section(story, insights, registered_fonts, BODY_STYLE)
-
-        # 3. GPT 기반 전략 제안 (AI 인사이트가 있을 때만)
-        if insights:
-            strategic_recommendations = generate_strategic_recommendations(insights, financial_data, gpt_api_key)
-            story.append(Paragraph("3. SK에너지 전략 제안", HEADING_STYLE))
-            add_strategic_recommendations_section(story, strategic_recommendations, registered_fonts, HEADING_STYLE, BODY_STYLE)
-        else:
-            story.append(Paragraph("AI 인사이트가 없어 전략 제안을 생성하지 않았습니다.", BODY_STYLE))
+    doc = _make_doc(response_writer)
 
-        # 4. 뉴스 하이라이트 및 종합 분석
-        story.append(Paragraph("4. 뉴스 하이라이트 및 종합 분석", HEADING_STYLE))
-        add_news_section(story, news_data, insights, registered_fonts, HEADING_STYLE, BODY_STYLE)
+    story = []
 
-        # 푸터 (선택사항)
-        if show_footer:
-            story.append(Spacer(1, 24))
-            footer_text = "※ 본 보고서는 대시보드에서 자동 생성되었습니다."
-            story.append(Paragraph(footer_text, BODY_STYLE))
+    # 표지
+    story.append(Paragraph("손익개선을 위한 SK에너지 및 경쟁사 비교 분석 보고서", TITLE_STYLE))
+    story.append(Spacer(1, 20))
 
-        # 페이지 번호 추가 함수
-        def _page_number(canvas, doc):
-            try:
-                canvas.setFont('Helvetica', 9)
-                canvas.drawCentredString(A4[0] / 2, 20, f"- {canvas.getPageNumber()} -")
-            except Exception:
-                pass
-
-        # 빌드
-        doc.build(story, onFirstPage=_page_number, onLaterPages=_page_number)
-        buffer.seek(0)
+    report_info = _REPORT_INFO_TMPL.format(
+        d=_today_kr(datetime.now().date()),
+        t=safe_str_convert(report_target),
+        a=safe_str_convert(report_author),
+    )
+    story.append(Paragraph(report_info, BODY_STYLE))
+    story.append(Spacer(1, 30))
+
+    # 1. 재무분석 결과 (표 + 차트 이미지)
+    add_financial_data_section(story, financial_data, quarterly_df, chart_figures,
+                               registered_fonts, HEADING_STYLE, BODY_STYLE)
+
+    # 2. AI 인사이트
+    story.append(Paragraph("2. AI 분석 인사이트", HEADING_STYLE))
+    add_ai_insights_section(story, insights, registered_fonts, BODY_STYLE)
+
+    # 3. GPT 기반 전략 제안 (AI 인사이트가 있을 때만)
+    if insights:
+        strategic_recommendations = generate_strategic_recommendations(insights, financial_data, gpt_api_key)
+        story.append(Paragraph("3. SK에너지 전략 제안", HEADING_STYLE))
+        add_strategic_recommendations_section(story, strategic_recommendations, registered_fonts, HEADING_STYLE, BODY_STYLE)
+    else:
+        story.append(Paragraph("AI 인사이트가 없어 전략 제안을 생성하지 않았습니다.", BODY_STYLE))
+
+    # 4. 뉴스 하이라이트 및 종합 분석
+    story.append(Paragraph("4. 뉴스 하이라이트 및 종합 분석", HEADING_STYLE))
+    add_news_section(story, news_data, insights, registered_fonts, HEADING_STYLE, BODY_STYLE)
+
+    # 푸터 (선택사항)
+    if show_footer:
+        story.append(Spacer(1, 24))
+        footer_text = "※ 본 보고서는 대시보드에서 자동 생성되었습니다."
+        story.append(Paragraph(footer_text, BODY_STYLE))
+
+    # 빌드 (response_writer로 직접 기록)
+    doc.build(story, onFirstPage=_page_number, onLaterPages=_page_number)
+
+
+# --------------------------
+# PDF 보고서 생성 (메인)
+# --------------------------
+def create_enhanced_pdf_report(
+    financial_data=None,
+    news_data=None,
+    insights=None,
+    chart_figures=None,  # matplotlib (또는 plotly) Figure 리스트
+    quarterly_df=None,
+    show_footer=False,
+    report_target="SK이노베이션 경영진",
+    report_author="보고자 미기재",
+    gpt_api_key=None,
+    font_paths=None,
+):
+    """
+    향상된 PDF 보고서 생성 (matplotlib 차트 직접 삽입, bytes 반환)
+    파일 등에 바로 기록하려면 stream_enhanced_pdf_report 사용
+    """
+    try:
+        buffer = io.BytesIO()
+        stream_enhanced_pdf_report(
+            buffer,
+            financial_data=financial_data,
+            news_data=news_data,
+            insights=insights,
+            chart_figures=chart_figures,
+            quarterly_df=quarterly_df,
+            show_footer=show_footer,
+            report_target=report_target,
+            report_author=report_author,
+            gpt_api_key=gpt_api_key,
+            font_paths=font_paths,
+        )
         return buffer.getvalue()
 
     except Exception as e:
@@ -603,11 +1293,11 @@ def create_enhanced_pdf_report(
             buffer = io.BytesIO()
             doc = SimpleDocTemplate(buffer, pagesize=A4)
             error_story = [
-                Paragraph("보고서 생성 오류", getSampleStyleSheet()['Title']),
+                Paragraph("보고서 생성 오류", _DEFAULT_STYLES['Title']),
                 Spacer(1, 20),
-                Paragraph(f"오류 내용: {str(e)}", getSampleStyleSheet()['Normal']),
+                Paragraph(f"오류 내용: {str(e)}", _DEFAULT_STYLES['Normal']),
                 Spacer(1, 12),
-                Paragraph("시스템 관리자에게 문의해주세요.", getSampleStyleSheet()['Normal'])
+                Paragraph("시스템 관리자에게 문의해주세요.", _DEFAULT_STYLES['Normal'])
             ]
             doc.build(error_story)
             buffer.seek(0)
@@ -623,7 +1313,7 @@ def generate_report_with_gpt_insights(
     financial_data=None,
     news_data=None,
     insights=None,
-    chart_figures=None,  # matplotlib Figure 리스트
+    chart_figures=None,  # matplotlib (또는 plotly) Figure 리스트
     quarterly_df=None,
     gpt_api_key=None,
     **kwargs
@@ -661,25 +1351,17 @@ def generate_report_with_gpt_insights(
 # 의존성 체크
 # --------------------------
 def check_dependencies():
-    """필요한 패키지들이 설치되어 있는지 체크"""
+    """필요한 패키지들이 설치되어 있는지 체크 (import 시 확인한 플래그 사용)"""
+    # reportlab, pandas는 이 모듈 import 시점에 이미 로드됨 (matplotlib는 차트 변환 시 로드)
     missing = []
-    try:
-        import matplotlib  # noqa
-    except Exception:
+    if not HAS_MATPLOTLIB:
         missing.append('matplotlib')
-    try:
-        import reportlab  # noqa
-    except Exception:
-        missing.append('reportlab')
-    try:
-        import pandas  # noqa
-    except Exception:
-        missing.append('pandas')
-    try:
-        import openpyxl  # noqa
-    except Exception:
+    if not HAS_OPENPYXL:
         missing.append('openpyxl')
 
+    if HAS_OPENPYXL and not HAS_LXML:
+        print("참고: lxml을 설치하면 Excel(openpyxl write_only) 저장이 더 빨라집니다. pip install lxml")
+
     if missing:
         print("다음 패키지를 설치하세요:")
         for m in missing:
@@ -711,6 +1393,8 @@ if __name__ == "__main__":
     })
 
     # 간단 matplotlib 차트 예시
+    import matplotlib.pyplot as plt
+
     fig1, ax1 = plt.subplots(figsize=(6, 3))
     ax1.bar(['SK', 'SOil', 'GS'], [10, 9.5, 8.8])
     ax1.set_title("예시 회사별 매출 (단위: 조원)")
@@ -1,17 +1,26 @@
 # -*- coding: utf-8 -*-
+import importlib.util
+from functools import lru_cache
 import pandas as pd
 from .table import get_company_color # visualization 폴더 내의 table 모듈에서 import
 
-try:
+# plotly는 import 비용이 커서 설치 여부만 확인하고, 실제 로드는 첫 차트 생성 시 1회
+PLOTLY_AVAILABLE = importlib.util.find_spec('plotly') is not None
+
+@lru_cache(maxsize=1)
+def _px():
     import plotly.express as px
+    return px
+
+@lru_cache(maxsize=1)
+def _go():
     import plotly.graph_objects as go
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+    return go
 
 def create_sk_bar_chart(chart_df: pd.DataFrame):
     """SK에너지 강조 막대 차트"""
     if not PLOTLY_AVAILABLE or chart_df.empty: return None
+    px = _px()
     
     companies = chart_df['회사'].unique()
     color_map = {comp: get_company_color(comp, companies) for comp in companies}
@@ -36,31 +45,23 @@ def create_sk_radar_chart(chart_df):
     companies = chart_df['회사'].unique() if '회사' in chart_df.columns else []
     metrics = chart_df['구분'].unique() if '구분' in chart_df.columns else []
     
-    # 지표별 최소, 최대값 계산
-    min_max = {}
-    for metric in metrics:
-        values = chart_df.loc[chart_df['구분'] == metric, '수치']
-        min_val = values.min()
-        max_val = values.max()
-        # 최소 최대값이 같으면 max_val = min_val + 1로 설정(0 나누기 방지)
-        if min_val == max_val:
-            max_val = min_val + 1
-        min_max[metric] = (min_val, max_val)
+    # 회사 x 지표 피벗 (회사/지표 순서는 등장 순서로 고정)
+    normalized = None
+    if len(companies) > 0 and len(metrics) > 0:
+        pivot = chart_df.pivot_table(
+            index='회사', columns='구분', values='수치', aggfunc='first', dropna=False
+        ).reindex(index=companies, columns=metrics)
+        
+        # 지표별 Min-Max 정규화 (최소 최대값이 같으면 분모 1로 설정해 0 나누기 방지)
+        min_vals = pivot.min()
+        span = (pivot.max() - min_vals).where(lambda x: x != 0, 1)
+        normalized = ((pivot - min_vals) / span).fillna(0)
     
+    go = _go()
     fig = go.Figure()
     
     for i, company in enumerate(companies):
-        company_data = chart_df[chart_df['회사'] == company] if '회사' in chart_df.columns else chart_df
-        normalized_values = []
-        for metric in metrics:
-            raw_value = company_data.loc[company_data['구분'] == metric, '수치'].values
-            if len(raw_value) == 0:
-                norm_value = 0
-            else:
-                val = raw_value[0]
-                min_val, max_val = min_max[metric]
-                norm_value = (val - min_val) / (max_val - min_val)
-            normalized_values.append(norm_value)
+        normalized_values = normalized.loc[company].tolist()
         
         # 닫힌 도형을 위해 첫 값 반복
         normalized_values.append(normalized_values[0])
@@ -124,19 +125,20 @@ def create_quarterly_trend_chart(quarterly_df: pd.DataFrame):
     """분기별 추이 혼합 차트"""
     if not PLOTLY_AVAILABLE or quarterly_df.empty: return None
 
-    fig = go.Figure()
+    go = _go()
     companies = quarterly_df['회사'].unique()
 
-    for company in companies:
-        company_data = quarterly_df[quarterly_df['회사'] == company]
-        color = get_company_color(company, companies)
-        
-        # 매출액 (Bar)
-        if '매출액(조원)' in company_data.columns:
-            fig.add_trace(go.Bar(
-                x=company_data['분기'], y=company_data['매출액(조원)'], name=f"{company} 매출액(조)",
-                marker_color=color
-            ))
+    # 매출액 (Bar) - 회사별 trace를 한 번에 만들어 Figure 생성 시 함께 전달
+    traces = []
+    if '매출액(조원)' in quarterly_df.columns:
+        traces = [
+            go.Bar(
+                x=company_data['분기'].to_numpy(), y=company_data['매출액(조원)'].to_numpy(), name=f"{company} 매출액(조)",
+                marker_color=get_company_color(company, companies)
+            )
+            for company, company_data in quarterly_df.groupby('회사', sort=False)
+        ]
+    fig = go.Figure(data=traces)
     
     fig.update_layout(
         barmode='group', title="📈 분기별 매출액 추이",
@@ -149,21 +151,22 @@ def create_gap_trend_chart(quarterly_df: pd.DataFrame):
     """분기별 갭 추이 차트"""
     if not PLOTLY_AVAILABLE or quarterly_df.empty: return None
 
-    fig = go.Figure()
+    go = _go()
     companies = quarterly_df['회사'].unique()
 
-    for company in companies:
-        company_data = quarterly_df[quarterly_df['회사'] == company]
-        color = get_company_color(company, companies)
-        
-        # 영업이익률 (Line)
-        if '영업이익률(%)' in company_data.columns:
-            fig.add_trace(go.Scatter(
-                x=company_data['분기'], y=company_data['영업이익률(%)'], 
+    # 영업이익률 (Line) - 회사별 trace를 한 번에 만들어 Figure 생성 시 함께 전달
+    traces = []
+    if '영업이익률(%)' in quarterly_df.columns:
+        traces = [
+            go.Scatter(
+                x=company_data['분기'].to_numpy(), y=company_data['영업이익률(%)'].to_numpy(),
                 name=f"{company} 영업이익률(%)",
-                mode='lines+markers', line=dict(color=color, width=3),
+                mode='lines+markers', line=dict(color=get_company_color(company, companies), width=3),
                 marker=dict(size=8)
-            ))
+            )
+            for company, company_data in quarterly_df.groupby('회사', sort=False)
+        ]
+    fig = go.Figure(data=traces)
     
     fig.update_layout(
         title="📊 분기별 영업이익률 갭 추이",
@@ -188,62 +191,46 @@ def create_gap_analysis(financial_df: pd.DataFrame, raw_cols: list):
     if not sk_col:
         return pd.DataFrame()
     
-    gap_analysis = []
+    # 행 단위 루프 대신 컬럼 단위 벡터 연산 (SK에너지 값이 0인 지표는 제외)
+    sk_values = pd.to_numeric(financial_df[sk_col], errors='coerce')
+    mask = sk_values != 0
+    if not mask.any():
+        return pd.DataFrame()
     
-    for _, row in financial_df.iterrows():
-        indicator = row['구분']
-        sk_value = row.get(sk_col, 0)
-        
-        if sk_value == 0:
-            continue
+    sk_values = sk_values[mask]
+    gap_analysis = pd.DataFrame({'지표': financial_df.loc[mask, '구분'], 'SK에너지': sk_values})
+    
+    for col in raw_cols:
+        if col != sk_col:
+            company_name = col.replace('_원시값', '')
+            company_values = pd.to_numeric(financial_df.loc[mask, col], errors='coerce')
             
-        gap_data = {'지표': indicator, 'SK에너지': sk_value}
-        
-        for col in raw_cols:
-            if col != sk_col:
-                company_name = col.replace('_원시값', '')
-                company_value = row.get(col, 0)
-                
-                # 갭차이 계산 (SK에너지 대비)
-                if sk_value != 0:
-                    gap_percentage = ((company_value - sk_value) / abs(sk_value)) * 100
-                    gap_amount = company_value - sk_value
-                else:
-                    gap_percentage = 0
-                    gap_amount = company_value
-                
-                gap_data[f'{company_name}_갭(%)'] = round(gap_percentage, 2)
-                gap_data[f'{company_name}_갭(금액)'] = gap_amount
-                gap_data[f'{company_name}_원본값'] = company_value
-        
-        gap_analysis.append(gap_data)
+            # 갭차이 계산 (SK에너지 대비)
+            gap_analysis[f'{company_name}_갭(%)'] = ((company_values - sk_values) / sk_values.abs() * 100).round(2)
+            gap_analysis[f'{company_name}_갭(금액)'] = company_values - sk_values
+            gap_analysis[f'{company_name}_원본값'] = company_values
     
-    return pd.DataFrame(gap_analysis)
+    return gap_analysis.reset_index(drop=True)
 
 def create_gap_chart(gap_analysis_df: pd.DataFrame):
     """갭차이 시각화 차트"""
     if not PLOTLY_AVAILABLE or gap_analysis_df.empty:
         return None
+    px = _px()
     
     # 갭% 컬럼만 추출
     gap_cols = [col for col in gap_analysis_df.columns if col.endswith('_갭(%)')]
     if not gap_cols:
         return None
     
-    # 데이터 준비
-    chart_data = []
-    for _, row in gap_analysis_df.iterrows():
-        indicator = row['지표']
-        for col in gap_cols:
-            company = col.replace('_갭(%)', '')
-            gap_value = row[col]
-            chart_data.append({
-                '지표': indicator,
-                '회사': company,
-                '갭(%)': gap_value
-            })
-    
-    chart_df = pd.DataFrame(chart_data)
+    # 데이터 준비 (wide → long, 지표별로 회사 순서 유지)
+    chart_df = (
+        gap_analysis_df.reset_index(drop=True)
+        .melt(id_vars='지표', value_vars=gap_cols, var_name='회사', value_name='갭(%)', ignore_index=False)
+        .sort_index(kind='stable')
+        .reset_index(drop=True)
+    )
+    chart_df['회사'] = chart_df['회사'].str.replace('_갭(%)', '', regex=False)
     
     # 색상 매핑
     companies = chart_df['회사'].unique()